@@ -0,0 +1,128 @@
+"""
+OpenAI Batch API client for non-interactive workloads
+"""
+import json
+import time
+from io import BytesIO
+from friday.config import Config
+from friday.ai.openai_client import create_openai_client
+from friday.utils.logger import get_logger
+
+logger = get_logger("batch_client")
+
+# Batch states after which polling stops
+_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchClient:
+    """Submits chat completions through the Batch API (half price, separate rate limits)"""
+
+    def __init__(self):
+        """Initialize batch client"""
+        self.client = create_openai_client()
+        self.model = Config.get("ai", "model", default="gpt-4o")
+        self.max_tokens = Config.get("ai", "max_tokens", default=500)
+        self.temperature = Config.get("ai", "temperature", default=0.7)
+
+        logger.info(f"Batch client initialized with model: {self.model}")
+
+    def submit_batch(self, messages_list):
+        """
+        Upload a batch of chat completion requests
+
+        Args:
+            messages_list: List of message lists, one per request
+
+        Returns:
+            str: Batch ID
+        """
+        try:
+            lines = []
+            for i, messages in enumerate(messages_list):
+                lines.append(json.dumps({
+                    "custom_id": f"request-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": messages,
+                        "max_tokens": self.max_tokens,
+                        "temperature": self.temperature
+                    }
+                }))
+
+            batch_input = BytesIO("\n".join(lines).encode("utf-8"))
+            batch_input.name = "batch_input.jsonl"
+
+            input_file = self.client.files.create(file=batch_input, purpose="batch")
+
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+
+            logger.info(f"Submitted batch {batch.id} with {len(messages_list)} requests")
+            return batch.id
+
+        except Exception as e:
+            logger.error(f"Failed to submit batch: {e}")
+            raise
+
+    def wait_for_batch(self, batch_id, poll_interval=30, timeout=None):
+        """
+        Wait for a batch to finish and collect its responses
+
+        Args:
+            batch_id: Batch ID from submit_batch
+            poll_interval: Seconds between status checks
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            list: Response texts in submission order (None for failed requests)
+        """
+        try:
+            start_time = time.time()
+
+            while True:
+                batch = self.client.batches.retrieve(batch_id)
+                logger.debug(f"Batch {batch_id} status: {batch.status}")
+
+                if batch.status in _FINAL_STATUSES:
+                    break
+
+                if timeout is not None and time.time() - start_time > timeout:
+                    raise TimeoutError(f"Batch {batch_id} not finished after {timeout}s")
+
+                time.sleep(poll_interval)
+
+            if batch.status != "completed":
+                raise RuntimeError(f"Batch {batch_id} ended with status: {batch.status}")
+
+            total = batch.request_counts.total if batch.request_counts else 0
+            results = [None] * total
+
+            if batch.output_file_id:
+                output = self.client.files.content(batch.output_file_id).text
+
+                for line in output.splitlines():
+                    if not line.strip():
+                        continue
+
+                    record = json.loads(line)
+                    index = int(record["custom_id"].rsplit("-", 1)[1])
+
+                    response = record.get("response") or {}
+                    if response.get("status_code") == 200:
+                        if index >= len(results):
+                            results.extend([None] * (index + 1 - len(results)))
+                        results[index] = response["body"]["choices"][0]["message"]["content"]
+                    else:
+                        logger.warning(f"Batch request {record['custom_id']} failed: {record.get('error')}")
+
+            logger.info(f"Batch {batch_id} complete: {sum(r is not None for r in results)}/{len(results)} succeeded")
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to collect batch {batch_id}: {e}")
+            raise
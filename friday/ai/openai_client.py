@@ -1,24 +1,90 @@
 """
 OpenAI API client wrapper
 """
-from openai import OpenAI
+import asyncio
+import importlib.util
+import threading
+import httpx
+from openai import OpenAI, AsyncOpenAI
 from openai import OpenAIError, RateLimitError, APIError
 import time
 from friday.config import Config
+from friday.ai.rate_limiter import AsyncRateLimiter
+from friday.models.message import Message
 from friday.utils.logger import get_logger
 
 logger = get_logger("openai_client")
 
 
+def _build_shared_http_client():
+    """
+    Build the HTTP client shared by every synchronous OpenAI client
+
+    Returns:
+        httpx.Client: Keep-alive client (HTTP/2 when the h2 package is installed)
+    """
+    # Presence check only; httpx imports h2 itself when HTTP/2 is enabled
+    http2 = importlib.util.find_spec("h2") is not None
+
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=300),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+
+
+# One connection pool for chat, TTS and STT so a single warm TLS session serves all
+_shared_http = _build_shared_http_client()
+
+
+def create_openai_client():
+    """
+    Create an OpenAI client on the shared connection pool
+
+    Returns:
+        OpenAI: Client instance
+    """
+    return OpenAI(api_key=Config.OPENAI_API_KEY, http_client=_shared_http)
+
+
 class OpenAIClient:
     """Wrapper for OpenAI API with error handling and retry logic"""
 
     def __init__(self):
         """Initialize OpenAI client"""
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = create_openai_client()
+
+        # Async client keeps one keep-alive connection pool so concurrent
+        # requests overlap instead of each paying for a new TLS handshake
+        self.aclient = AsyncOpenAI(
+            api_key=Config.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60
+                ),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+        )
+
         self.model = Config.get("ai", "model", default="gpt-4o")
         self.max_tokens = Config.get("ai", "max_tokens", default=500)
         self.temperature = Config.get("ai", "temperature", default=0.7)
+        self.max_concurrency = Config.get("ai", "max_concurrency", default=10)
+
+        # Throttle before sending instead of colliding with the API limits
+        self.rate_limiter = AsyncRateLimiter(
+            max_requests_per_minute=Config.get("ai", "max_requests_per_minute", default=500),
+            max_tokens_per_minute=Config.get("ai", "max_tokens_per_minute", default=30000)
+        )
+
+        # Gate for in-flight async requests
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Background event loop used to run async requests from worker threads
+        self._loop = None
+        self._loop_lock = threading.Lock()
 
         logger.info(f"OpenAI client initialized with model: {self.model}")
 
@@ -37,12 +103,16 @@ class OpenAIClient:
             try:
                 logger.debug(f"Sending chat completion request (attempt {attempt + 1})")
 
-                response = self.client.chat.completions.create(
+                self.rate_limiter.acquire_sync(self._estimate_tokens(messages))
+
+                raw_response = self.client.chat.completions.with_raw_response.create(
                     model=self.model,
                     messages=messages,
                     max_tokens=self.max_tokens,
                     temperature=self.temperature
                 )
+                self.rate_limiter.update_from_headers(raw_response.headers)
+                response = raw_response.parse()
 
                 assistant_message = response.choices[0].message.content
                 logger.info(f"Received response: {len(assistant_message)} chars")
@@ -72,6 +142,227 @@ class OpenAIClient:
                 logger.error(f"Unexpected error in chat completion: {e}")
                 raise
 
+    def chat_stream(self, messages):
+        """
+        Stream a chat completion token by token
+
+        Args:
+            messages: List of message dicts for the API
+
+        Yields:
+            str: Text deltas as they arrive
+        """
+        try:
+            logger.debug("Sending streaming chat completion request")
+
+            self.rate_limiter.acquire_sync(self._estimate_tokens(messages))
+
+            raw_response = self.client.chat.completions.with_raw_response.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                stream=True
+            )
+            self.rate_limiter.update_from_headers(raw_response.headers)
+
+            for chunk in raw_response.parse():
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+        except OpenAIError as e:
+            logger.error(f"OpenAI error during streaming: {e}")
+            raise
+
+        except Exception as e:
+            logger.error(f"Unexpected error in chat stream: {e}")
+            raise
+
+    async def achat_completion(self, messages, max_retries=3):
+        """
+        Async chat completion with the same retry logic as chat_completion
+
+        Args:
+            messages: List of message dicts for the API
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            str: Assistant's response text
+        """
+        async with self._semaphore:
+            for attempt in range(max_retries):
+                try:
+                    logger.debug(f"Sending async chat completion request (attempt {attempt + 1})")
+
+                    await self.rate_limiter.acquire(self._estimate_tokens(messages))
+
+                    raw_response = await self.aclient.chat.completions.with_raw_response.create(
+                        model=self.model,
+                        messages=messages,
+                        max_tokens=self.max_tokens,
+                        temperature=self.temperature
+                    )
+                    self.rate_limiter.update_from_headers(raw_response.headers)
+                    response = raw_response.parse()
+
+                    assistant_message = response.choices[0].message.content
+                    logger.info(f"Received response: {len(assistant_message)} chars")
+
+                    return assistant_message
+
+                except RateLimitError as e:
+                    wait_time = 2 ** attempt  # Exponential backoff
+                    logger.warning(f"Rate limit hit, waiting {wait_time}s: {e}")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(wait_time)
+                    else:
+                        raise
+
+                except APIError as e:
+                    logger.error(f"API error: {e}")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(1)
+                    else:
+                        raise
+
+                except OpenAIError as e:
+                    logger.error(f"OpenAI error: {e}")
+                    raise
+
+                except Exception as e:
+                    logger.error(f"Unexpected error in async chat completion: {e}")
+                    raise
+
+    async def chat_completion_with_image(self, text, image_data, system_prompt=None):
+        """
+        Async chat completion for a text prompt with one image
+
+        Args:
+            text: Prompt text
+            image_data: Base64 image data URI (see encode_image_for_gpt4o)
+            system_prompt: Optional system prompt
+
+        Returns:
+            str: Assistant's response text
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        messages.append(Message(role="user", content=text, image_data=image_data).to_dict())
+
+        return await self.achat_completion(messages)
+
+    async def chat_completion_many(self, list_of_messages):
+        """
+        Run several chat completions concurrently
+
+        Args:
+            list_of_messages: List of message lists, one per request
+
+        Returns:
+            list: Response texts in the same order as the requests
+        """
+        return await asyncio.gather(
+            *[self.achat_completion(messages) for messages in list_of_messages]
+        )
+
+    def chat_completion_batch(self, list_of_messages):
+        """
+        Blocking wrapper around chat_completion_many for threaded callers
+
+        Args:
+            list_of_messages: List of message lists, one per request
+
+        Returns:
+            list: Response texts in the same order as the requests
+        """
+        return self._run_async(self.chat_completion_many(list_of_messages))
+
+    def gather(self, *coroutines):
+        """
+        Run async requests concurrently from synchronous code
+
+        Example:
+            text, vision = client.gather(
+                client.achat_completion(messages),
+                client.chat_completion_with_image(prompt, image_data)
+            )
+
+        Args:
+            coroutines: Coroutines from the async methods of this client
+
+        Returns:
+            list: Results in argument order
+        """
+        async def _gather_all():
+            return await asyncio.gather(*coroutines)
+
+        return self._run_async(_gather_all())
+
+    def _estimate_tokens(self, messages):
+        """
+        Rough token cost of a request for rate limiting
+
+        Args:
+            messages: List of message dicts for the API
+
+        Returns:
+            int: Estimated prompt plus completion tokens
+        """
+        prompt_chars = 0
+        for message in messages:
+            content = message.get("content") or ""
+            if isinstance(content, str):
+                prompt_chars += len(content)
+            else:
+                # Multimodal content: count only the text parts
+                for part in content:
+                    if part.get("type") == "text":
+                        prompt_chars += len(part.get("text", ""))
+
+        return prompt_chars // 4 + self.max_tokens
+
+    def _run_async(self, coro):
+        """
+        Run a coroutine on the shared background event loop and wait for it
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Result of the coroutine
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                # One long-lived loop so the async connection pool stays valid
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    daemon=True,
+                    name="openai-async-loop"
+                ).start()
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def warmup(self):
+        """
+        Open the connection to the API ahead of the first real request
+
+        Uses a model lookup, which costs no tokens, so the TCP/TLS setup is
+        already done when the user first speaks.
+        """
+        try:
+            start = time.time()
+            self.client.models.retrieve(self.model)
+            logger.info(f"OpenAI connection warmed up in {time.time() - start:.2f}s")
+
+        except Exception as e:
+            logger.warning(f"OpenAI warmup failed: {e}")
+
     def test_connection(self):
         """
         Test OpenAI API connection
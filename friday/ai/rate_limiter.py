@@ -0,0 +1,134 @@
+"""
+Token-bucket rate limiter for OpenAI requests
+"""
+import asyncio
+import threading
+import time
+from friday.utils.logger import get_logger
+
+logger = get_logger("rate_limiter")
+
+
+class AsyncRateLimiter:
+    """Throttles requests against requests-per-minute and tokens-per-minute budgets"""
+
+    def __init__(self, max_requests_per_minute, max_tokens_per_minute):
+        """
+        Initialize rate limiter
+
+        Args:
+            max_requests_per_minute: Request budget per minute
+            max_tokens_per_minute: Token budget per minute
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+
+        # Both buckets start full and refill continuously
+        self.available_request_capacity = float(max_requests_per_minute)
+        self.available_token_capacity = float(max_tokens_per_minute)
+        self.last_update_time = time.monotonic()
+
+        # Shared between the async loop and worker threads
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"Rate limiter initialized: {max_requests_per_minute} RPM, "
+            f"{max_tokens_per_minute} TPM"
+        )
+
+    def _refill(self):
+        """Refill both buckets for the wall-clock time elapsed since last update"""
+        now = time.monotonic()
+        elapsed = now - self.last_update_time
+        self.last_update_time = now
+
+        self.available_request_capacity = min(
+            self.available_request_capacity + self.max_requests_per_minute * elapsed / 60.0,
+            self.max_requests_per_minute
+        )
+        self.available_token_capacity = min(
+            self.available_token_capacity + self.max_tokens_per_minute * elapsed / 60.0,
+            self.max_tokens_per_minute
+        )
+
+    def _reserve(self, tokens):
+        """
+        Try to take capacity for one request
+
+        Args:
+            tokens: Estimated token cost of the request
+
+        Returns:
+            float: 0 if capacity was taken, otherwise seconds to wait before retrying
+        """
+        # Never ask for more than a full bucket, or the request could never pass
+        tokens = min(tokens, self.max_tokens_per_minute)
+
+        with self._lock:
+            self._refill()
+
+            if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                self.available_request_capacity -= 1
+                self.available_token_capacity -= tokens
+                return 0.0
+
+            request_deficit = max(0.0, 1 - self.available_request_capacity)
+            token_deficit = max(0.0, tokens - self.available_token_capacity)
+
+        return max(
+            request_deficit * 60.0 / self.max_requests_per_minute,
+            token_deficit * 60.0 / self.max_tokens_per_minute
+        )
+
+    async def acquire(self, tokens):
+        """
+        Wait until the request fits in both budgets
+
+        Args:
+            tokens: Estimated token cost of the request
+        """
+        while True:
+            wait_time = self._reserve(tokens)
+            if wait_time <= 0:
+                return
+            logger.debug(f"Throttling request for {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+
+    def acquire_sync(self, tokens):
+        """
+        Blocking variant of acquire for synchronous callers
+
+        Args:
+            tokens: Estimated token cost of the request
+        """
+        while True:
+            wait_time = self._reserve(tokens)
+            if wait_time <= 0:
+                return
+            logger.debug(f"Throttling request for {wait_time:.2f}s")
+            time.sleep(wait_time)
+
+    def update_from_headers(self, headers):
+        """
+        Recalibrate buckets from the server's remaining-quota headers
+
+        Args:
+            headers: Response headers mapping
+        """
+        try:
+            remaining_requests = headers.get("x-ratelimit-remaining-requests")
+            remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+
+            with self._lock:
+                self._refill()
+                if remaining_requests is not None:
+                    self.available_request_capacity = min(
+                        self.available_request_capacity, float(remaining_requests)
+                    )
+                if remaining_tokens is not None:
+                    self.available_token_capacity = min(
+                        self.available_token_capacity, float(remaining_tokens)
+                    )
+
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Could not parse rate limit headers: {e}")
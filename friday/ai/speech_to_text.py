@@ -1,9 +1,14 @@
 """
 Speech-to-Text using OpenAI Whisper API
 """
-from openai import OpenAI
+import hashlib
+import mimetypes
+from io import BytesIO
 from pathlib import Path
 from friday.config import Config
+from friday.ai.openai_client import create_openai_client
+from friday.audio.audio_utils import audio_to_bytes
+from friday.utils.blob_cache import BlobCache
 from friday.utils.logger import get_logger
 
 logger = get_logger("stt")
@@ -12,12 +17,96 @@ logger = get_logger("stt")
 class SpeechToText:
     """Speech-to-Text handler using OpenAI Whisper API"""
 
-    def __init__(self):
-        """Initialize STT client"""
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+    def __init__(self, backend=None):
+        """
+        Initialize STT client
+
+        Args:
+            backend: "api" for the Whisper API or "local" for faster-whisper
+                     (uses the ai.stt_backend setting if None)
+        """
+        self.client = create_openai_client()
         self.model = "whisper-1"
+        self.backend = backend or Config.get("ai", "stt_backend", default="api")
+        self.local_model = None
+        self.local_model_size = None
+
+        # Transcripts keyed by a hash of the exact audio uploaded
+        self.cache = BlobCache(Config.LOGS_DIR / "stt_cache.db")
+
+        if self.backend == "local":
+            self._load_local_model()
+        else:
+            logger.info("STT initialized with Whisper API")
+
+    def _load_local_model(self):
+        """Load the faster-whisper model, falling back to the API if unavailable"""
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            logger.warning("faster-whisper not installed. Falling back to Whisper API")
+            logger.warning("Install with: pip install faster-whisper")
+            self.backend = "api"
+            logger.info("STT initialized with Whisper API")
+            return
+
+        try:
+            model_size = Config.get("ai", "stt_local_model", default="small")
+
+            # int8 weights: half the memory of fp16 and fast on CPU
+            self.local_model = WhisperModel(model_size, device="auto", compute_type="int8")
+            self.local_model_size = model_size
 
-        logger.info("STT initialized with Whisper API")
+            logger.info(f"STT initialized with local faster-whisper ({model_size})")
+
+        except Exception as e:
+            logger.error(f"Failed to load local Whisper model: {e}")
+            self.backend = "api"
+
+    def _transcribe_local(self, audio):
+        """
+        Transcribe with the local model
+
+        Args:
+            audio: 16 kHz mono float32 array, file path or file-like object
+
+        Returns:
+            str: Transcribed text
+        """
+        segments, _ = self.local_model.transcribe(audio, beam_size=1, vad_filter=True)
+        return "".join(segment.text for segment in segments).strip()
+
+    def transcribe_array(self, audio_data, sample_rate=16000):
+        """
+        Transcribe recorded float32 audio
+
+        The local backend takes the samples directly; the API backend
+        encodes them to WAV first.
+
+        Args:
+            audio_data: Numpy array of float32 audio
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            str: Transcribed text
+        """
+        if self.backend != "local" or sample_rate != 16000:
+            return self.transcribe_bytes(audio_to_bytes(audio_data, sample_rate))
+
+        try:
+            logger.info("Transcribing audio locally")
+
+            # Whisper wants mono samples
+            samples = audio_data[:, 0] if audio_data.ndim > 1 else audio_data
+
+            text = self._transcribe_local(samples)
+            logger.info(f"Transcription: '{text}'")
+
+            return text
+
+        except Exception as e:
+            logger.error(f"STT error: {e}")
+            raise
 
     def transcribe_file(self, audio_file_path):
         """
@@ -32,6 +121,11 @@ class SpeechToText:
         try:
             logger.info(f"Transcribing audio file: {audio_file_path}")
 
+            if self.backend == "local":
+                text = self._transcribe_local(str(audio_file_path))
+                logger.info(f"Transcription: '{text}'")
+                return text
+
             with open(audio_file_path, 'rb') as audio_file:
                 transcript = self.client.audio.transcriptions.create(
                     model=self.model,
@@ -61,19 +155,43 @@ class SpeechToText:
         try:
             logger.info("Transcribing audio from bytes")
 
-            # Create a file-like object from bytes
-            from io import BytesIO
-            audio_file = BytesIO(audio_bytes)
-            audio_file.name = filename
+            # Engine is part of the key so API and local transcripts never mix
+            if self.backend == "local":
+                engine = f"local:{self.local_model_size}"
+            else:
+                engine = f"api:{self.model}"
+
+            digest = hashlib.sha256(engine.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(audio_bytes)
+            cache_key = digest.digest()
+
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                text = cached.decode("utf-8")
+                logger.info(f"Transcription (cached): '{text}'")
+                return text
+
+            if self.backend == "local":
+                text = self._transcribe_local(BytesIO(audio_bytes))
+                logger.info(f"Transcription: '{text}'")
+                self.cache.put(cache_key, text.encode("utf-8"))
+                return text
+
+            # Upload the in-memory WAV as-is; the SDK accepts a
+            # (filename, content, content_type) tuple, so no file wrapper is needed
+            content_type = mimetypes.guess_type(filename)[0] or "audio/wav"
 
             transcript = self.client.audio.transcriptions.create(
                 model=self.model,
-                file=audio_file
+                file=(filename, audio_bytes, content_type)
             )
 
             text = transcript.text
             logger.info(f"Transcription: '{text}'")
 
+            self.cache.put(cache_key, text.encode("utf-8"))
+
             return text
 
         except Exception as e:
@@ -1,25 +1,74 @@
 """
 Text-to-Speech using OpenAI TTS API
 """
-from openai import OpenAI
+import hashlib
 import io
+import re
+import queue
+import threading
 import sounddevice as sd
 import soundfile as sf
 import numpy as np
 from friday.config import Config
+from friday.ai.openai_client import create_openai_client
+from friday.utils.blob_cache import BlobCache
 from friday.utils.logger import get_logger
 
 logger = get_logger("tts")
 
+# OpenAI streams "pcm" responses as raw 24 kHz 16-bit mono
+PCM_SAMPLE_RATE = 24000
+
+# Sentence end, optionally followed by whitespace
+_SENTENCE_END = re.compile(r'[.?!]\s*$')
+
+
+def is_sentence_boundary(text, token_count, max_tokens=80):
+    """
+    Decide whether streamed text is ready to be spoken
+
+    Args:
+        text: Text buffered since the last flush
+        token_count: Number of tokens in the buffer
+        max_tokens: Flush regardless of punctuation after this many tokens
+
+    Returns:
+        bool: True if the buffer should be sent to TTS
+    """
+    if _SENTENCE_END.search(text):
+        return True
+
+    # A clause break is a good place to flush once there is enough to say
+    if text.rstrip().endswith((",", ";", ":")) and len(text.split()) >= 4:
+        return True
+
+    return token_count >= max_tokens
+
 
 class TextToSpeech:
     """Text-to-Speech handler using OpenAI TTS API"""
 
     def __init__(self):
         """Initialize TTS client"""
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = create_openai_client()
         self.voice = Config.get("ai", "tts_voice", default="alloy")
         self.model = "tts-1"  # Use tts-1 for faster, lower latency (not tts-1-hd)
+        self.speed = 1.3  # Speed up by 30% (range: 0.25 to 4.0)
+
+        # Repeated phrases are served from cache instead of the API
+        self.cache = BlobCache(Config.LOGS_DIR / "tts_cache.db")
+
+        # Streamed PCM chunks are played by one long-lived output stream
+        self._playback_queue = queue.Queue()
+        self._playback_thread = None
+        self._playback_lock = threading.Lock()
+
+        # speak() is called from several threads; one utterance enqueues at a time
+        self._utterance_lock = threading.Lock()
+
+        # Sentences queued from a streaming reply are synthesized one at a time
+        self._synthesis_queue = queue.Queue(maxsize=32)
+        self._synthesis_thread = None
 
         logger.info(f"TTS initialized with voice: {self.voice}, model: {self.model}")
 
@@ -32,25 +81,33 @@ class TextToSpeech:
             play_audio: Whether to play the audio immediately
 
         Returns:
-            bytes: Audio data
+            bytes: Raw 24 kHz 16-bit mono PCM (not MP3) when play_audio
+                   is True, MP3 when it is False
         """
         try:
             logger.info(f"Converting text to speech: '{text[:50]}...'")
 
-            # Generate speech with streaming for lower latency
+            if play_audio:
+                # Stream raw PCM so playback starts with the first chunk
+                return self._stream_and_play(text)
+
+            cache_key = self._cache_key(text, "mp3")
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("TTS cache hit")
+                return cached
+
             response = self.client.audio.speech.create(
                 model=self.model,
                 voice=self.voice,
                 input=text,
                 response_format="mp3",  # MP3 is faster to generate
-                speed=1.3  # Speed up by 30% (range: 0.25 to 4.0)
+                speed=self.speed
             )
 
             # Get audio bytes
             audio_bytes = response.content
-
-            if play_audio:
-                self.play_audio(audio_bytes)
+            self.cache.put(cache_key, audio_bytes)
 
             return audio_bytes
 
@@ -58,6 +115,129 @@ class TextToSpeech:
             logger.error(f"TTS error: {e}")
             raise
 
+    def speak_queued(self, text):
+        """
+        Queue text to be spoken after anything already queued
+
+        Args:
+            text: Text to convert to speech
+        """
+        with self._playback_lock:
+            if self._synthesis_thread is None or not self._synthesis_thread.is_alive():
+                self._synthesis_thread = threading.Thread(
+                    target=self._synthesis_worker,
+                    daemon=True,
+                    name="tts-synthesis"
+                )
+                self._synthesis_thread.start()
+
+        self._synthesis_queue.put(text)
+
+    def wait_for_queued_speech(self):
+        """Block until every queued sentence has been synthesized"""
+        self._synthesis_queue.join()
+
+    def _synthesis_worker(self):
+        """Synthesize queued sentences in order"""
+        while True:
+            text = self._synthesis_queue.get()
+            try:
+                self.speak(text, play_audio=True)
+            except Exception:
+                pass  # Already logged by speak()
+            finally:
+                self._synthesis_queue.task_done()
+
+    def _stream_and_play(self, text):
+        """
+        Stream PCM speech and queue each chunk for playback as it arrives
+
+        Holds the utterance lock throughout so chunks from overlapping
+        calls are never interleaved on the shared playback queue
+
+        Args:
+            text: Text to convert to speech
+
+        Returns:
+            bytes: Raw 24 kHz 16-bit mono PCM audio
+        """
+        self._ensure_playback_thread()
+
+        with self._utterance_lock:
+            cache_key = self._cache_key(text, "pcm")
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("TTS cache hit")
+                self._playback_queue.put(np.frombuffer(cached, dtype=np.int16))
+                return cached
+
+            pcm = bytearray()
+            carry = b""
+
+            with self.client.audio.speech.with_streaming_response.create(
+                model=self.model,
+                voice=self.voice,
+                input=text,
+                response_format="pcm",  # No container, no decode step
+                speed=self.speed
+            ) as response:
+                for chunk in response.iter_bytes(4096):
+                    pcm += chunk
+
+                    # Keep whole 16-bit samples; hold an odd trailing byte for the next chunk
+                    if carry:
+                        chunk = carry + chunk
+                    usable = len(chunk) - (len(chunk) % 2)
+                    carry = chunk[usable:]
+
+                    if usable:
+                        self._playback_queue.put(np.frombuffer(chunk[:usable], dtype=np.int16))
+
+            logger.info(f"Streamed {len(pcm)} bytes of speech")
+
+            pcm = bytes(pcm)
+            self.cache.put(cache_key, pcm)
+
+            return pcm
+
+    def _cache_key(self, text, response_format):
+        """
+        Cache key for a synthesized phrase
+
+        Args:
+            text: Text being spoken
+            response_format: Audio format requested from the API
+
+        Returns:
+            bytes: SHA-256 digest covering every parameter that changes the audio
+        """
+        return hashlib.sha256(
+            f"{self.voice}|{self.model}|{self.speed}|{response_format}|{text}".encode("utf-8")
+        ).digest()
+
+    def _ensure_playback_thread(self):
+        """Start the playback worker if it is not running"""
+        with self._playback_lock:
+            if self._playback_thread is None or not self._playback_thread.is_alive():
+                self._playback_thread = threading.Thread(
+                    target=self._playback_worker,
+                    daemon=True,
+                    name="tts-playback"
+                )
+                self._playback_thread.start()
+
+    def _playback_worker(self):
+        """Write queued PCM chunks to a single output stream in order"""
+        try:
+            with sd.OutputStream(samplerate=PCM_SAMPLE_RATE, channels=1, dtype='int16') as stream:
+                logger.debug("Playback stream opened")
+                while True:
+                    chunk = self._playback_queue.get()
+                    stream.write(chunk)
+
+        except Exception as e:
+            logger.error(f"Audio playback error: {e}")
+
     def play_audio(self, audio_bytes):
         """
         Play audio bytes in background thread for non-blocking playback
@@ -8,6 +8,24 @@ from friday.utils.logger import get_logger
 
 logger = get_logger("vision")
 
+# Data URI prefix for OpenAI API
+_DATA_URI_PREFIX = b"data:image/jpeg;base64,"
+
+# Optional: libjpeg-turbo's SIMD encoder via PyTurboJPEG
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420, TJFLAG_FASTDCT
+except ImportError:
+    TurboJPEG = None
+
+_turbo = None
+
+# Optional: libvips resizes with vectorized kernels and encodes JPEG in one pipeline
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
 
 def encode_image_for_gpt4o(image, max_size=2048, quality=85):
     """
@@ -22,39 +40,118 @@ def encode_image_for_gpt4o(image, max_size=2048, quality=85):
         str: Base64 encoded image with data URI prefix
     """
     try:
-        # Make a copy to avoid modifying original
-        img = image.copy()
+        if pyvips is not None:
+            img_bytes = _encode_jpeg_vips(image, max_size, quality)
+        else:
+            img_bytes = _encode_jpeg_pillow(image, max_size, quality)
 
-        # Resize if too large (for token efficiency)
-        if max(img.size) > max_size:
-            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-            logger.info(f"Resized image from {image.size} to {img.size}")
+        # Build the data URI in one buffer: base64 reads the JPEG buffer
+        # directly and the ASCII decode skips UTF-8 validation
+        data_uri = bytearray(_DATA_URI_PREFIX)
+        data_uri += base64.b64encode(img_bytes)
 
-        # Convert to JPEG with compression
-        buffered = BytesIO()
+        logger.info(
+            f"Encoded image: {len(data_uri) - len(_DATA_URI_PREFIX)} chars, {len(img_bytes)} bytes"
+        )
+        return data_uri.decode('ascii')
 
-        # Convert RGBA to RGB if needed
-        if img.mode == 'RGBA':
-            # Create white background
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])  # Use alpha channel as mask
-            img = background
+    except Exception as e:
+        logger.error(f"Failed to encode image: {e}")
+        raise
 
-        img.save(buffered, format="JPEG", quality=quality)
 
-        # Get base64 string
-        img_bytes = buffered.getvalue()
-        img_base64 = base64.b64encode(img_bytes).decode('utf-8')
+def _encode_jpeg_pillow(image, max_size, quality):
+    """
+    Resize and JPEG-encode with Pillow
 
-        # Return with data URI prefix for OpenAI API
-        data_uri = f"data:image/jpeg;base64,{img_base64}"
+    Args:
+        image: PIL Image object
+        max_size: Maximum dimension size
+        quality: JPEG quality (1-100)
 
-        logger.info(f"Encoded image: {len(img_base64)} chars, {len(img_bytes)} bytes")
-        return data_uri
+    Returns:
+        bytes or memoryview: JPEG data
+    """
+    img = image
+
+    # Resize if too large (for token efficiency). resize() returns a new
+    # image, so the original is left untouched without a full copy first
+    if max(img.size) > max_size:
+        scale = max_size / max(img.size)
+        new_size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+        img = img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        logger.info(f"Resized image from {image.size} to {img.size}")
+
+    # Convert RGBA to RGB if needed
+    if img.mode == 'RGBA':
+        # Create white background
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[3])  # Use alpha channel as mask
+        img = background
+
+    turbo = _get_turbo()
+    if turbo is not None and img.mode == 'RGB':
+        return turbo.encode(
+            np.asarray(img),
+            quality=quality,
+            pixel_format=TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+            flags=TJFLAG_FASTDCT
+        )
+
+    # Convert to JPEG with compression
+    buffered = BytesIO()
+    img.save(buffered, format="JPEG", quality=quality)
+
+    # View of the encoded bytes, no copy out of the BytesIO
+    return buffered.getbuffer()
+
+
+def _get_turbo():
+    """
+    Get the shared TurboJPEG encoder
 
-    except Exception as e:
-        logger.error(f"Failed to encode image: {e}")
-        raise
+    Returns:
+        TurboJPEG or None: Encoder, None if PyTurboJPEG or libturbojpeg is missing
+    """
+    global _turbo, TurboJPEG
+
+    if _turbo is None and TurboJPEG is not None:
+        try:
+            _turbo = TurboJPEG()
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"libturbojpeg not available, using Pillow JPEG encoder: {e}")
+            TurboJPEG = None
+
+    return _turbo
+
+
+def _encode_jpeg_vips(image, max_size, quality):
+    """
+    Resize and JPEG-encode with libvips
+
+    Args:
+        image: PIL Image object
+        max_size: Maximum dimension size
+        quality: JPEG quality (1-100)
+
+    Returns:
+        bytes: JPEG data
+    """
+    img = image if image.mode in ('RGB', 'RGBA') else image.convert('RGB')
+    bands = len(img.mode)
+
+    vimg = pyvips.Image.new_from_memory(img.tobytes(), img.width, img.height, bands, 'uchar')
+
+    # Flatten alpha onto a white background, same as the Pillow path
+    if bands == 4:
+        vimg = vimg.flatten(background=[255, 255, 255])
+
+    if max(img.size) > max_size:
+        vimg = vimg.thumbnail_image(max_size, height=max_size)
+        logger.info(f"Resized image from {image.size} to {(vimg.width, vimg.height)}")
+
+    return vimg.jpegsave_buffer(Q=quality)
 
 
 def encode_image_file(file_path, max_size=2048, quality=85):
@@ -1,6 +1,7 @@
 """
 Audio recorder with silence detection
 """
+import logging
 import sounddevice as sd
 import numpy as np
 from pathlib import Path
@@ -16,13 +17,13 @@ class AudioRecorder:
 
     def __init__(self):
         """Initialize audio recorder"""
-        self.sample_rate = Config.get("audio", "sample_rate", default=16000)
-        self.channels = Config.get("audio", "channels", default=1)
+        self.sample_rate = Config.audio().sample_rate
+        self.channels = Config.audio().channels
 
         # Use environment variable for silence settings (overrides JSON config)
         self.silence_threshold = float(Config.SILENCE_THRESHOLD)
         self.silence_duration = float(Config.SILENCE_DURATION)
-        self.max_duration = Config.get("audio", "max_recording_duration", default=30)
+        self.max_duration = Config.audio().max_recording_duration
 
         # Calculate chunks needed for silence detection
         self.chunk_size = 1024
@@ -31,16 +32,36 @@ class AudioRecorder:
         )
         self.max_chunks = int((self.max_duration * self.sample_rate) / self.chunk_size)
 
+        # Phrase segmentation for transcribing while the user is still talking
+        self.segment_pause_chunks = max(1, int((0.5 * self.sample_rate) / self.chunk_size))
+        self.min_segment_chunks = int((1.5 * self.sample_rate) / self.chunk_size)
+
+        # Progress is logged about once per second during the minimum recording period
+        self._chunks_per_log = max(1, round(self.sample_rate / self.chunk_size))
+
         self.is_recording = False
-        self.audio_frames = []
+
+        # Compile (or load from cache) the silence kernel now, with the same
+        # dtype and threshold type as the live loop, so the first recording
+        # doesn't stall on it and overflow the input stream
+        detect_silence(np.zeros((self.chunk_size, self.channels), dtype=np.float32), self.silence_threshold)
+
+        # Recording buffer, sized for max_duration and filled in place
+        self.audio_buf = None
+        self.write_idx = 0
 
         logger.info(f"AudioRecorder initialized: {self.sample_rate}Hz, {self.channels}ch")
         logger.info(f"Silence settings: threshold={self.silence_threshold}, duration={self.silence_duration}s")
 
-    def record_with_silence_detection(self):
+    def record_with_silence_detection(self, on_segment=None):
         """
         Record audio until silence detected
 
+        Args:
+            on_segment: Optional callback receiving each finished phrase
+                        (at least 1.5s, ended by a 0.5s pause) while recording
+                        continues, then the final phrase once recording stops
+
         Returns:
             numpy.ndarray: Recorded audio data
         """
@@ -48,12 +69,24 @@ class AudioRecorder:
             logger.info("Starting recording with silence detection...")
             logger.info(f"Using threshold={self.silence_threshold}, duration={self.silence_duration}s")
 
-            self.audio_frames = []
+            # One allocation per recording instead of a copy per chunk plus a
+            # final concatenate; np.empty does not touch the pages up front
+            self.audio_buf = np.empty(
+                (self.max_chunks * self.chunk_size, self.channels), dtype=np.float32
+            )
+            self.write_idx = 0
+            chunk_count = 0
             silence_counter = 0
             self.is_recording = True
 
+            # Segment state (only used with on_segment)
+            segment_start = 0
+            segment_has_sound = False
+            pause_chunks = 0
+
             # Minimum recording time before checking for silence (3 seconds - longer!)
             min_recording_chunks = int((3.0 * self.sample_rate) / self.chunk_size)
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             logger.info(f"Will record minimum {3.0}s before checking for silence")
 
             with sd.InputStream(
@@ -71,13 +104,32 @@ class AudioRecorder:
                         logger.warning("Audio buffer overflow")
 
                     # Store audio
-                    self.audio_frames.append(audio_chunk.copy())
+                    frames = len(audio_chunk)
+                    self.audio_buf[self.write_idx:self.write_idx + frames] = audio_chunk
+                    self.write_idx += frames
+                    chunk_count += 1
 
-                    # Only start checking for silence after minimum recording time
-                    if len(self.audio_frames) > min_recording_chunks:
-                        # Check for silence
-                        is_silent = detect_silence(audio_chunk, self.silence_threshold)
+                    # Check for silence
+                    is_silent = detect_silence(audio_chunk, self.silence_threshold)
 
+                    # Hand off each finished phrase so it can be transcribed now
+                    if on_segment is not None:
+                        if is_silent:
+                            pause_chunks += 1
+                        else:
+                            pause_chunks = 0
+                            segment_has_sound = True
+
+                        segment_chunks = (self.write_idx - segment_start) // self.chunk_size
+                        if (segment_has_sound
+                                and pause_chunks == self.segment_pause_chunks
+                                and segment_chunks >= self.min_segment_chunks):
+                            on_segment(self.audio_buf[segment_start:self.write_idx])
+                            segment_start = self.write_idx
+                            segment_has_sound = False
+
+                    # Only start checking for silence after minimum recording time
+                    if chunk_count > min_recording_chunks:
                         if is_silent:
                             silence_counter += 1
                         else:
@@ -87,19 +139,22 @@ class AudioRecorder:
                         if silence_counter >= self.silence_chunks_needed:
                             logger.info(f"Silence detected for {self.silence_duration}s, stopping...")
                             break
-                    else:
+                    elif debug_enabled and chunk_count % self._chunks_per_log == 0:
                         # Still in minimum recording period
-                        current_time = len(self.audio_frames) * self.chunk_size / self.sample_rate
-                        if int(current_time * 10) % 10 == 0:  # Log every 0.1s
-                            logger.debug(f"Recording... {current_time:.1f}s (min 3.0s)")
+                        current_time = self.write_idx / self.sample_rate
+                        logger.debug(f"Recording... {current_time:.1f}s (min 3.0s)")
 
                     # Safety: stop if max duration reached
-                    if len(self.audio_frames) >= self.max_chunks:
+                    if chunk_count >= self.max_chunks:
                         logger.warning(f"Max duration {self.max_duration}s reached, stopping...")
                         break
 
-            # Combine all frames
-            audio_data = np.concatenate(self.audio_frames)
+            # Recorded portion of the buffer (a view, no copy)
+            audio_data = self.audio_buf[:self.write_idx]
+
+            # Last phrase; skipped if it is only trailing silence
+            if on_segment is not None and segment_has_sound:
+                on_segment(self.audio_buf[segment_start:self.write_idx])
 
             duration = len(audio_data) / self.sample_rate
             logger.info(f"Recording complete: {duration:.2f}s, {len(audio_data)} samples")
@@ -1,13 +1,31 @@
 """
 Audio utilities and format conversions
 """
+import io
 import numpy as np
-import wave
+import soundfile as sf
 from friday.config import Config
 from friday.utils.logger import get_logger
 
 logger = get_logger("audio_utils")
 
+# Optional: compiled silence kernel for the realtime recording loop
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _is_silent_kernel(samples, threshold):
+        """Sum of squares in one vectorized pass, compared without sqrt"""
+        total = 0.0
+        for i in range(samples.size):
+            total += samples[i] * samples[i]
+        return total < threshold * threshold * samples.size
+else:
+    _is_silent_kernel = None
+
 
 def detect_silence(audio_chunk, threshold=None):
     """
@@ -21,12 +39,34 @@ def detect_silence(audio_chunk, threshold=None):
         bool: True if silent, False if sound detected
     """
     if threshold is None:
-        threshold = Config.get("audio", "silence_threshold", default=0.02)
+        threshold = Config.audio().silence_threshold
+
+    samples = audio_chunk.reshape(-1)
 
-    # Calculate RMS (root mean square) of audio chunk
-    rms = np.sqrt(np.mean(audio_chunk ** 2))
+    if _is_silent_kernel is not None:
+        return bool(_is_silent_kernel(samples, threshold))
 
-    return rms < threshold
+    # Mean square via a single dot product (no squared temporary), compared
+    # against the squared threshold so no sqrt is needed
+    mean_square = float(np.dot(samples, samples)) / samples.size
+
+    return mean_square < threshold * threshold
+
+
+def _frames_for_write(audio_data, channels):
+    """
+    Shape audio for soundfile, which takes channels from the array shape
+
+    Args:
+        audio_data: Numpy array of audio data
+        channels: Number of channels
+
+    Returns:
+        numpy.ndarray: 1-D for mono, (frames, channels) otherwise
+    """
+    if channels > 1 and audio_data.ndim == 1:
+        return audio_data.reshape(-1, channels)
+    return audio_data
 
 
 def save_audio_to_wav(audio_data, file_path, sample_rate=16000, channels=1):
@@ -44,17 +84,14 @@ def save_audio_to_wav(audio_data, file_path, sample_rate=16000, channels=1):
         if isinstance(audio_data, list):
             audio_data = np.concatenate(audio_data)
 
-        # Ensure audio is in correct format
-        if audio_data.dtype != np.int16:
-            # Convert float to int16
-            audio_data = (audio_data * 32767).astype(np.int16)
-
-        # Write WAV file
-        with wave.open(str(file_path), 'wb') as wav_file:
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(2)  # 2 bytes for int16
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data.tobytes())
+        # libsndfile writes the header and converts float to 16-bit PCM natively
+        sf.write(
+            str(file_path),
+            _frames_for_write(audio_data, channels),
+            sample_rate,
+            format='WAV',
+            subtype='PCM_16'
+        )
 
         logger.info(f"Audio saved to {file_path}")
 
@@ -75,20 +112,16 @@ def audio_to_bytes(audio_data, sample_rate=16000, channels=1):
     Returns:
         bytes: WAV file as bytes
     """
-    import io
-
-    # Ensure audio is in correct format
-    if audio_data.dtype != np.int16:
-        audio_data = (audio_data * 32767).astype(np.int16)
-
     # Create in-memory bytes buffer
     buffer = io.BytesIO()
 
-    with wave.open(buffer, 'wb') as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(2)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(audio_data.tobytes())
+    # libsndfile writes the header and converts float to 16-bit PCM natively
+    sf.write(
+        buffer,
+        _frames_for_write(audio_data, channels),
+        sample_rate,
+        format='WAV',
+        subtype='PCM_16'
+    )
 
-    buffer.seek(0)
     return buffer.getvalue()
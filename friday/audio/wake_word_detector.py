@@ -4,6 +4,7 @@ Wake word detection using Porcupine
 import pvporcupine
 import sounddevice as sd
 import numpy as np
+import threading
 from collections import deque
 from friday.config import Config
 from friday.utils.logger import get_logger
@@ -28,7 +29,18 @@ class WakeWordDetector:
         self.porcupine = None
         self.audio_stream = None
         self.is_listening = False
-        self.audio_buffer = deque()
+
+        # Slot indices handed from the audio callback to the inference thread
+        # (~2s at 512 samples/frame; oldest frames are dropped if it falls behind)
+        self.audio_buffer = deque(maxlen=64)
+
+        # Preallocated frame storage (allocated in start() once frame_length is known).
+        # Twice the queue length, so a slot is never rewritten while still queued
+        self._frame_ring = None
+        self._ring_idx = 0
+        self._frames_ready = threading.Event()
+        self._consumer_thread = None
+        self._last_status = None
 
         logger.info(f"WakeWordDetector initialized with wake word: '{self.wake_word}'")
 
@@ -56,6 +68,19 @@ class WakeWordDetector:
             # Start audio stream
             self.is_listening = True
 
+            # Porcupine runs here, off the PortAudio callback thread
+            self.audio_buffer.clear()
+            self._frame_ring = np.empty(
+                (2 * self.audio_buffer.maxlen, self.porcupine.frame_length), dtype=np.int16
+            )
+            self._ring_idx = 0
+            self._consumer_thread = threading.Thread(
+                target=self._consumer,
+                daemon=True,
+                name="wake-word"
+            )
+            self._consumer_thread.start()
+
             self.audio_stream = sd.InputStream(
                 samplerate=self.porcupine.sample_rate,
                 channels=1,
@@ -82,6 +107,13 @@ class WakeWordDetector:
                 self.audio_stream.close()
                 self.audio_stream = None
 
+            # Let the consumer exit before Porcupine is freed under it
+            self._frames_ready.set()
+            if (self._consumer_thread
+                    and self._consumer_thread is not threading.current_thread()):
+                self._consumer_thread.join(timeout=1)
+            self._consumer_thread = None
+
             if self.porcupine:
                 self.porcupine.delete()
                 self.porcupine = None
@@ -95,6 +127,9 @@ class WakeWordDetector:
         """
         Audio stream callback for wake word detection
 
+        Runs on the PortAudio thread, so it only queues the frame; no
+        logging or inference here.
+
         Args:
             indata: Input audio data
             frames: Number of frames
@@ -102,28 +137,47 @@ class WakeWordDetector:
             status: Stream status
         """
         if status:
-            logger.warning(f"Audio stream status: {status}")
+            self._last_status = status
 
         if not self.is_listening:
             return
 
-        try:
-            # Get audio frame (flatten from 2D to 1D)
-            audio_frame = indata.flatten()
+        # Copy the mono column view into a preallocated slot; PortAudio
+        # reuses indata, and this avoids allocating a new array per frame
+        slot = self._ring_idx
+        self._frame_ring[slot] = indata[:, 0]
+        self._ring_idx = (slot + 1) % len(self._frame_ring)
 
-            # Process with Porcupine
-            keyword_index = self.porcupine.process(audio_frame)
+        self.audio_buffer.append(slot)
+        self._frames_ready.set()
 
-            # Check if wake word detected
-            if keyword_index >= 0:
-                logger.info(f"🎤 Wake word '{self.wake_word}' detected!")
+    def _consumer(self):
+        """Pop queued frames and run Porcupine on them"""
+        while self.is_listening:
+            self._frames_ready.wait(timeout=0.5)
+            self._frames_ready.clear()
 
-                # Call callback if provided
-                if self.callback:
-                    self.callback()
+            if self._last_status:
+                logger.warning(f"Audio stream status: {self._last_status}")
+                self._last_status = None
 
-        except Exception as e:
-            logger.error(f"Error in audio callback: {e}")
+            while self.is_listening and self.audio_buffer:
+                try:
+                    audio_frame = self._frame_ring[self.audio_buffer.popleft()]
+
+                    # Process with Porcupine
+                    keyword_index = self.porcupine.process(audio_frame)
+
+                    # Check if wake word detected
+                    if keyword_index >= 0:
+                        logger.info(f"🎤 Wake word '{self.wake_word}' detected!")
+
+                        # Call callback if provided
+                        if self.callback:
+                            self.callback()
+
+                except Exception as e:
+                    logger.error(f"Error in wake word processing: {e}")
 
     def is_running(self):
         """Check if wake word detection is running"""
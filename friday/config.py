@@ -2,10 +2,18 @@
 Configuration management for Friday AI Assistant
 """
 import os
+import copy
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
+# Optional: faster JSON parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv(override=True)
 
@@ -29,38 +37,59 @@ class Config:
     SILENCE_DURATION = float(os.getenv("SILENCE_DURATION", "1.5"))
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+    # Defaults used when settings.json is missing (and for missing audio keys)
+    _DEFAULT_SETTINGS = {
+        "audio": {
+            "sample_rate": 16000,
+            "channels": 1,
+            "silence_threshold": 0.02,
+            "silence_duration": 1.5,
+            "max_recording_duration": 30
+        },
+        "ai": {
+            "model": "gpt-4o",
+            "max_tokens": 500,
+            "temperature": 0.7,
+            "tts_voice": "alloy"
+        },
+        "gui": {
+            "window_width": 800,
+            "window_height": 600,
+            "theme": "dark"
+        }
+    }
+
     # Default settings from JSON
     _settings = {}
 
+    # Audio settings as plain attributes for hot paths (set by load_settings,
+    # read through audio())
+    AUDIO = None
+
     @classmethod
     def load_settings(cls):
         """Load settings from JSON file"""
         settings_file = cls.CONFIG_DIR / "settings.json"
         if settings_file.exists():
-            with open(settings_file, 'r') as f:
-                cls._settings = json.load(f)
+            if orjson is not None:
+                cls._settings = orjson.loads(settings_file.read_bytes())
+            else:
+                with open(settings_file, 'r') as f:
+                    cls._settings = json.load(f)
         else:
             # Default settings if file doesn't exist
-            cls._settings = {
-                "audio": {
-                    "sample_rate": 16000,
-                    "channels": 1,
-                    "silence_threshold": 0.02,
-                    "silence_duration": 1.5,
-                    "max_recording_duration": 30
-                },
-                "ai": {
-                    "model": "gpt-4o",
-                    "max_tokens": 500,
-                    "temperature": 0.7,
-                    "tts_voice": "alloy"
-                },
-                "gui": {
-                    "window_width": 800,
-                    "window_height": 600,
-                    "theme": "dark"
-                }
-            }
+            cls._settings = copy.deepcopy(cls._DEFAULT_SETTINGS)
+
+        cls.AUDIO = SimpleNamespace(
+            **{**cls._DEFAULT_SETTINGS["audio"], **cls._settings.get("audio", {})}
+        )
+
+    @classmethod
+    def audio(cls):
+        """Get audio settings namespace, loading settings on first use"""
+        if cls.AUDIO is None:
+            cls.load_settings()
+        return cls.AUDIO
 
     @classmethod
     def get(cls, *keys, default=None):
@@ -89,6 +118,3 @@ class Config:
 
         return errors
 
-
-# Load settings on import
-Config.load_settings()
@@ -2,6 +2,7 @@
 Debug Window for WhatsApp Message Monitoring
 """
 import customtkinter as ctk
+import queue
 from datetime import datetime
 from typing import List
 
@@ -9,6 +10,29 @@ from typing import List
 class DebugWindow(ctk.CTkToplevel):
     """Debug window to show WhatsApp monitoring activity"""
 
+    # Keep at most this many lines; older lines are trimmed in batches
+    MAX_LINES = 2000
+    TRIM_BATCH = 200
+
+    # Pending lines are written at most once per frame (~30 FPS)
+    FLUSH_INTERVAL_MS = 33
+
+    # Pump slows down after this many empty passes
+    FLUSH_IDLE_MS = 250
+    IDLE_PUMPS_BEFORE_BACKOFF = 10
+
+    # Lines written per pump; the rest wait for the next frame
+    PUMP_BATCH = 200
+
+    # Text color per log level (applied through textbox tags)
+    _LEVEL_COLORS = {
+        "ERROR": "#ff4444",
+        "WARNING": "#ffaa00",
+        "SUCCESS": "#44ff44",
+        "DEBUG": "#888888",
+        "INFO": "#ffffff",
+    }
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -23,9 +47,21 @@ class DebugWindow(ctk.CTkToplevel):
             self,
             width=580,
             height=350,
-            font=("Consolas", 10)
+            font=("Consolas", 10),
+            undo=False,
+            state="disabled"  # Read-only; enabled only while writing
         )
         self.text_area.pack(padx=10, pady=(10, 5), fill="both", expand=True)
+        self._line_count = 0
+
+        # Configure one tag per level once, instead of styling every line
+        for level, color in self._LEVEL_COLORS.items():
+            self.text_area.tag_config(level, foreground=color)
+
+        # Lines waiting for the next pump; log_message may be called from any thread
+        self._inbox = queue.Queue()
+        self._idle_pumps = 0
+        self._pump_id = None
 
         # Clear button
         self.clear_btn = ctk.CTkButton(
@@ -39,33 +75,109 @@ class DebugWindow(ctk.CTkToplevel):
         # Initialize log
         self.log_message("Debug window initialized", "INFO")
 
+        # Only the Tk thread touches the textbox, through this pump
+        self._pump_id = self.after(self.FLUSH_INTERVAL_MS, self._pump)
+
     def log_message(self, message: str, level: str = "INFO"):
-        """Add a log message to the debug window"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # Color coding
-        if level == "ERROR":
-            color = "#ff4444"
-        elif level == "WARNING":
-            color = "#ffaa00"
-        elif level == "SUCCESS":
-            color = "#44ff44"
-        elif level == "DEBUG":
-            color = "#888888"
+        """Add a log message to the debug window (safe from any thread)"""
+        log_entry = f"[{datetime.now():%H:%M:%S}] [{level}] {message}\n"
+
+        # Unknown levels fall back to the INFO color
+        tag = level if level in self._LEVEL_COLORS else "INFO"
+        self._inbox.put((log_entry, tag))
+
+    def _pump(self):
+        """Drain queued lines on the Tk thread and reschedule"""
+        entries = []
+        try:
+            while len(entries) < self.PUMP_BATCH:
+                entries.append(self._inbox.get_nowait())
+        except queue.Empty:
+            pass
+
+        if entries:
+            self._idle_pumps = 0
+            self._flush(entries)
         else:
-            color = "#ffffff"
-
-        log_entry = f"[{timestamp}] [{level}] {message}\n"
+            self._idle_pumps += 1
 
-        # Insert at the end
-        self.text_area.insert("end", log_entry)
-        self.text_area.see("end")  # Auto-scroll to bottom
+        # Back off while nothing is being logged
+        if self._idle_pumps >= self.IDLE_PUMPS_BEFORE_BACKOFF:
+            delay = self.FLUSH_IDLE_MS
+        else:
+            delay = self.FLUSH_INTERVAL_MS
+        self._pump_id = self.after(delay, self._pump)
+
+    def _flush(self, entries):
+        """
+        Write a batch of lines to the textbox
+
+        Args:
+            entries: (log_entry, tag) pairs in arrival order
+        """
+        # Follow new lines only if the user has not scrolled up
+        at_bottom = self.text_area.yview()[1] > 0.999
+
+        self.text_area.configure(state="normal")
+
+        # Insert at the end, one insert per run of lines sharing a level
+        run_lines = []
+        run_tag = entries[0][1]
+        for log_entry, tag in entries:
+            if tag != run_tag:
+                self._insert_run(run_lines, run_tag)
+                run_lines = []
+                run_tag = tag
+            run_lines.append(log_entry)
+        self._insert_run(run_lines, run_tag)
+
+        # Trim the oldest lines once the cap is exceeded by a full batch,
+        # so the delete cost is paid every TRIM_BATCH lines, not per insert
+        if self._line_count >= self.MAX_LINES + self.TRIM_BATCH:
+            excess = self._line_count - self.MAX_LINES
+            self.text_area.delete("1.0", f"{excess + 1}.0")
+            self._line_count -= excess
+
+        self.text_area.configure(state="disabled")
+
+        if at_bottom:
+            self.text_area.yview_moveto(1.0)
+
+    def _insert_run(self, lines, tag):
+        """
+        Insert consecutive lines that share a level
+
+        Args:
+            lines: Formatted log lines
+            tag: Level tag to color them with
+        """
+        blob = "".join(lines)
+        self.text_area.insert("end", blob, tag)
+        self._line_count += blob.count("\n")
 
     def clear_log(self):
         """Clear all log messages"""
+        # Drop lines that have not been written yet
+        try:
+            while True:
+                self._inbox.get_nowait()
+        except queue.Empty:
+            pass
+
+        self.text_area.configure(state="normal")
         self.text_area.delete("1.0", "end")
+        self.text_area.configure(state="disabled")
+        self._line_count = 0
         self.log_message("Log cleared", "INFO")
 
+    def destroy(self):
+        """Stop the pump before the window goes away"""
+        pump_id = getattr(self, '_pump_id', None)
+        if pump_id is not None:
+            self.after_cancel(pump_id)
+            self._pump_id = None
+        super().destroy()
+
     def log_check_start(self, check_number: int):
         """Log start of message check"""
         self.log_message(f"=== Check #{check_number} ===", "DEBUG")
@@ -10,6 +10,47 @@ from friday.gui.debug_window import DebugWindow
 
 logger = get_logger("gui")
 
+# Event polling: fast while events are flowing, slower once the queue stays empty
+POLL_ACTIVE_MS = 100
+POLL_IDLE_MS = 500
+IDLE_TICKS_BEFORE_BACKOFF = 5
+
+# Events handled per poll; a full batch re-polls almost immediately
+EVENT_BATCH_SIZE = 32
+POLL_BACKLOG_MS = 10
+
+# Shared colors
+IDLE_COLOR = "#666666"
+MUTED_TEXT_COLOR = "#888888"
+SUCCESS_COLOR = "#4CAF50"
+
+# Status indicator color per status
+STATUS_COLORS = {
+    "Idle": IDLE_COLOR,
+    "Listening": "#FF6B6B",
+    "Processing": "#FFA500",
+    "Speaking": SUCCESS_COLOR
+}
+
+# One CTkFont per size, shared by every widget that uses it
+_FONT_CACHE = {}
+
+
+def _font(size):
+    """
+    Get a shared font of the given size
+
+    Args:
+        size: Font size
+
+    Returns:
+        ctk.CTkFont: Cached font
+    """
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = ctk.CTkFont(size=size)
+    return font
+
 
 class MainWindow:
     """Main application window"""
@@ -17,9 +58,15 @@ class MainWindow:
     def __init__(self, app):
         self.app = app
         self.event_queue = queue.Queue()
+
+        # Bound once; both are called on every event
+        self._handle_gui_event = getattr(app, 'handle_gui_event', None)
+        self._queue_put = self.event_queue.put
         self.screenshot_attached = False
         self.current_screenshot = None
         self.debug_window = None  # Debug window for WhatsApp monitoring
+        self._debug_alive = False  # Tracks the debug window without asking Tk
+        self._idle_ticks = 0  # Consecutive polls that found no events
 
         # Set appearance
         ctk.set_appearance_mode("dark")
@@ -46,7 +93,7 @@ class MainWindow:
         self._create_widgets()
 
         # Start event polling
-        self.root.after(100, self._check_events)
+        self.root.after(POLL_ACTIVE_MS, self._check_events)
 
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -87,15 +134,15 @@ class MainWindow:
         self.status_indicator = ctk.CTkLabel(
             status_frame,
             text="●",
-            font=ctk.CTkFont(size=20),
-            text_color="#666666"
+            font=_font(20),
+            text_color=IDLE_COLOR
         )
         self.status_indicator.pack(side="left", padx=(0, 5))
 
         self.status_label = ctk.CTkLabel(
             status_frame,
             text="Idle",
-            font=ctk.CTkFont(size=14)
+            font=_font(14)
         )
         self.status_label.pack(side="left")
 
@@ -166,8 +213,8 @@ class MainWindow:
         self.screenshot_status = ctk.CTkLabel(
             screenshot_frame,
             text="",
-            font=ctk.CTkFont(size=11),
-            text_color="#888888"
+            font=_font(11),
+            text_color=MUTED_TEXT_COLOR
         )
         self.screenshot_status.pack(side="left", padx=10)
 
@@ -180,7 +227,7 @@ class MainWindow:
             input_frame,
             placeholder_text="Type a message or say 'Jarvis' to use voice...",
             height=40,
-            font=ctk.CTkFont(size=13)
+            font=_font(13)
         )
         self.text_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
         self.text_entry.bind("<Return>", self._on_send_text)
@@ -218,10 +265,10 @@ class MainWindow:
 
         if self.screenshot_attached:
             self.attach_btn.configure(fg_color="#2D5F3F", text="✓ Attached")
-            self.screenshot_status.configure(text="Screenshot will be included in next message", text_color="#4CAF50")
+            self.screenshot_status.configure(text="Screenshot will be included in next message", text_color=SUCCESS_COLOR)
         else:
             self.attach_btn.configure(fg_color="#1f538d", text="📎 Attach to Next Message")
-            self.screenshot_status.configure(text="Screenshot captured", text_color="#888888")
+            self.screenshot_status.configure(text="Screenshot captured", text_color=MUTED_TEXT_COLOR)
 
     def _send_text_message(self):
         """Send text message from entry field"""
@@ -295,17 +342,9 @@ class MainWindow:
         """
         self.status_label.configure(text=status)
 
-        # Status color mapping
-        status_colors = {
-            "Idle": "#666666",
-            "Listening": "#FF6B6B",
-            "Processing": "#FFA500",
-            "Speaking": "#4CAF50"
-        }
-
         # Use provided color or auto-determine from status
         if color is None:
-            color = status_colors.get(status, "#666666")
+            color = STATUS_COLORS.get(status, IDLE_COLOR)
 
         self.status_indicator.configure(text_color=color)
 
@@ -315,7 +354,7 @@ class MainWindow:
         self.attach_btn.configure(state="normal")
         self.screenshot_status.configure(
             text="Screenshot captured! Click 'Attach' to include in next message",
-            text_color="#4CAF50"
+            text_color=SUCCESS_COLOR
         )
         logger.info("Screenshot captured and ready to attach")
 
@@ -336,19 +375,55 @@ class MainWindow:
 
     def publish_event(self, event_type, data):
         """Publish event to application"""
-        if hasattr(self.app, 'handle_gui_event'):
-            self.app.handle_gui_event(event_type, data)
+        if self._handle_gui_event is not None:
+            self._handle_gui_event(event_type, data)
 
     def _check_events(self):
         """Poll event queue for updates from other threads"""
+        events = []
         try:
-            while True:
-                event = self.event_queue.get_nowait()
-                self._handle_event(event)
+            for _ in range(EVENT_BATCH_SIZE):
+                events.append(self.event_queue.get_nowait())
         except queue.Empty:
             pass
+
+        try:
+            if events:
+                self._handle_event_batch(events)
         finally:
-            self.root.after(100, self._check_events)
+            # Back off when idle so Tk is not woken 10x/sec for nothing
+            if events:
+                self._idle_ticks = 0
+            else:
+                self._idle_ticks += 1
+
+            if len(events) == EVENT_BATCH_SIZE:
+                interval = POLL_BACKLOG_MS
+            elif self._idle_ticks < IDLE_TICKS_BEFORE_BACKOFF:
+                interval = POLL_ACTIVE_MS
+            else:
+                interval = POLL_IDLE_MS
+            self.root.after(interval, self._check_events)
+
+    def _handle_event_batch(self, events):
+        """
+        Handle a batch of events in order with a single layout flush
+
+        A status update immediately followed by another is skipped, since
+        it would be overwritten before the window redraws.
+
+        Args:
+            events: Events taken from the queue, oldest first
+        """
+        for event, following in zip(events, events[1:] + [None]):
+            if (event.get("type") == "status_update"
+                    and following is not None
+                    and following.get("type") == "status_update"):
+                continue
+
+            self._handle_event(event)
+
+        self.root.update_idletasks()
 
     def _handle_event(self, event):
         """Handle events from other threads"""
@@ -389,24 +464,32 @@ class MainWindow:
 
     def _toggle_debug_window(self):
         """Toggle debug window visibility"""
-        if self.debug_window is None or not self.debug_window.winfo_exists():
+        if not self._debug_alive:
             # Create new debug window
             self.debug_window = DebugWindow(self.root)
+            self.debug_window.protocol("WM_DELETE_WINDOW", self._on_debug_closed)
+            self._debug_alive = True
             logger.info("Debug window opened")
         else:
             # Close existing window
+            self._on_debug_closed()
+
+    def _on_debug_closed(self):
+        """Destroy the debug window and mark it closed"""
+        self._debug_alive = False
+        if self.debug_window is not None:
             self.debug_window.destroy()
             self.debug_window = None
-            logger.info("Debug window closed")
+        logger.info("Debug window closed")
 
     def log_debug(self, message: str, level: str = "INFO"):
         """Send log message to debug window if open"""
-        if self.debug_window and self.debug_window.winfo_exists():
+        if self._debug_alive:
             self.debug_window.log_message(message, level)
 
     def add_event(self, event_type, data):
         """Add event to queue (called from other threads)"""
-        self.event_queue.put({"type": event_type, "data": data})
+        self._queue_put({"type": event_type, "data": data})
 
     def run(self):
         """Start the GUI main loop"""
@@ -2,7 +2,10 @@
 Google Calendar Integration for Jarvis
 """
 import os
-import pickle
+import threading
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Dict
@@ -10,19 +13,44 @@ from friday.utils.logger import get_logger
 
 logger = get_logger("google_calendar")
 
+# How long fetched events are reused before hitting the API again
+CACHE_TTL = timedelta(seconds=60)
+
+# Returned by the _fetch_* methods on API errors so the failure isn't cached
+_FETCH_FAILED = object()
+
+# Built API clients keyed by account, reused across start() calls
+_SERVICE_CACHE = {}
+
+# Partial response: only the fields _parse_event reads
+_EVENT_FIELDS = 'items(summary,start(dateTime,date),end(dateTime,date),location,description)'
+
 
 class CalendarEvent:
     """Represents a calendar event"""
+    # No per-instance __dict__; one instance per cached event
+    __slots__ = ("summary", "start", "end", "location", "description", "_time_str")
+
     def __init__(self, summary: str, start: datetime, end: datetime, location: str = "", description: str = ""):
         self.summary = summary
         self.start = start
         self.end = end
         self.location = location
         self.description = description
+        self._time_str = None  # Formatted start time, filled on first use
+
+    @property
+    def time_str(self) -> str:
+        """Start time as 'HH:MM AM/PM' (same output as strftime("%I:%M %p"))"""
+        if self._time_str is None:
+            # Formatted by hand; strftime goes through the locale machinery
+            hour = self.start.hour
+            ampm = 'AM' if hour < 12 else 'PM'
+            self._time_str = f"{hour % 12 or 12:02d}:{self.start.minute:02d} {ampm}"
+        return self._time_str
 
     def __str__(self):
-        time_str = self.start.strftime("%I:%M %p")
-        return f"{self.summary} at {time_str}"
+        return f"{self.summary} at {self.time_str}"
 
     def to_dict(self):
         return {
@@ -34,6 +62,38 @@ class CalendarEvent:
         }
 
 
+# Bound once; called for every start/end of every event
+_ISO = datetime.fromisoformat
+
+
+def _parse_time(raw: str) -> datetime:
+    """
+    Parse an API dateTime/date string into a naive local datetime
+
+    Timed events come back with a UTC offset; converting them to naive
+    local time lets them be compared against datetime.now().
+    """
+    if raw.endswith('Z'):
+        raw = raw[:-1] + '+00:00'
+    dt = _ISO(raw)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt
+
+
+def _parse_event(ev: dict) -> CalendarEvent:
+    """Convert an API event resource into a CalendarEvent"""
+    s = ev['start']
+    e = ev['end']
+    return CalendarEvent(
+        summary=ev.get('summary', 'No title'),
+        start=_parse_time(s.get('dateTime') or s.get('date')),
+        end=_parse_time(e.get('dateTime') or e.get('date')),
+        location=ev.get('location', ''),
+        description=ev.get('description', '')
+    )
+
+
 class GoogleCalendarService:
     """Google Calendar integration service"""
 
@@ -43,6 +103,16 @@ class GoogleCalendarService:
         self.events_cache = []
         self.cache_time = None
 
+        # Interval index over events_cache for is_free_at
+        self._sorted_starts = []
+        self._max_ends = []
+
+        # (kind, args) -> (fetched_at, result); collapses repeated events().list calls
+        self._cache = {}
+
+        # Per-thread "now" pinned for the duration of one operation
+        self._local = threading.local()
+
     def start(self):
         """Initialize Google Calendar service"""
         try:
@@ -60,7 +130,8 @@ class GoogleCalendarService:
             creds = None
 
             # Token file stores user's access and refresh tokens
-            token_path = Path("config/google_calendar_token.pickle")
+            token_path = Path("config/google_calendar_token.json")
+            legacy_token_path = Path("config/google_calendar_token.pickle")
             credentials_path = Path("config/google_calendar_credentials.json")
 
             # Check if credentials file exists
@@ -71,8 +142,15 @@ class GoogleCalendarService:
 
             # Load saved credentials
             if token_path.exists():
-                with open(token_path, 'rb') as token:
+                creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            elif legacy_token_path.exists():
+                # One-time migration from the old pickled token
+                import pickle
+                with open(legacy_token_path, 'rb') as token:
                     creds = pickle.load(token)
+                token_path.write_text(creds.to_json())
+                legacy_token_path.unlink()
+                logger.info(f"Migrated calendar token to {token_path}")
 
             # If no valid credentials, login
             if not creds or not creds.valid:
@@ -85,11 +163,20 @@ class GoogleCalendarService:
 
                 # Save credentials
                 token_path.parent.mkdir(exist_ok=True)
-                with open(token_path, 'wb') as token:
-                    pickle.dump(creds, token)
-
-            # Build service
-            self.service = build('calendar', 'v3', credentials=creds)
+                token_path.write_text(creds.to_json())
+
+            # Build service once per account; the bundled discovery document
+            # avoids fetching it over the network
+            service_key = (getattr(creds, 'client_id', None), getattr(creds, 'refresh_token', None))
+            self.service = _SERVICE_CACHE.get(service_key)
+            if self.service is None:
+                self.service = build(
+                    'calendar', 'v3',
+                    credentials=creds,
+                    static_discovery=True,
+                    cache_discovery=False
+                )
+                _SERVICE_CACHE[service_key] = self.service
             self.enabled = True
 
             logger.info("Google Calendar service initialized successfully")
@@ -103,145 +190,159 @@ class GoogleCalendarService:
         """Cleanup"""
         self.service = None
         self.enabled = False
+        self._cache.clear()
         logger.info("Google Calendar service stopped")
 
+    def _now(self) -> datetime:
+        """Current time, or the pinned time inside _pinned_now()"""
+        pinned = getattr(self._local, 'now', None)
+        return pinned if pinned is not None else datetime.now()
+
+    @contextmanager
+    def _pinned_now(self):
+        """Make every _now() call in this thread see the same timestamp"""
+        if getattr(self._local, 'now', None) is not None:
+            # Already pinned by an outer caller
+            yield
+            return
+
+        self._local.now = datetime.now()
+        try:
+            yield
+        finally:
+            self._local.now = None
+
+    def _cached(self, key, thunk, default=None, ttl: timedelta = CACHE_TTL):
+        """
+        Return a cached fetch result, calling thunk only when it is stale
+
+        Args:
+            key: Cache key, (kind, args)
+            thunk: Zero-argument fetcher, returns _FETCH_FAILED on error
+            default: Returned when the fetch fails and nothing was cached
+            ttl: How long a result stays fresh
+
+        Returns:
+            Result of thunk (possibly cached)
+        """
+        now = self._now()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+
+        result = thunk()
+        if result is _FETCH_FAILED:
+            # Don't cache the failure; serve the last good result if there is one
+            return entry[1] if entry is not None else default
+
+        self._cache[key] = (now, result)
+        return result
+
     def get_todays_events(self) -> List[CalendarEvent]:
         """Get all events for today"""
         if not self.enabled:
             return []
 
+        return self._cached(("today",), self._fetch_todays_events, default=[])
+
+    def _fetch_todays_events(self) -> List[CalendarEvent]:
+        """Fetch today's events from the API"""
         try:
-            now = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            now = self._now().replace(hour=0, minute=0, second=0, microsecond=0)
             end_of_day = now + timedelta(days=1)
 
             events_result = self.service.events().list(
                 calendarId='primary',
                 timeMin=now.isoformat() + 'Z',
                 timeMax=end_of_day.isoformat() + 'Z',
+                maxResults=250,
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                fields=_EVENT_FIELDS
             ).execute()
 
             events = events_result.get('items', [])
-            calendar_events = []
-
-            for event in events:
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                end = event['end'].get('dateTime', event['end'].get('date'))
-
-                # Parse datetime
-                if 'T' in start:
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                else:
-                    start_dt = datetime.fromisoformat(start)
-                    end_dt = datetime.fromisoformat(end)
+            calendar_events = [_parse_event(ev) for ev in events]
 
-                calendar_events.append(CalendarEvent(
-                    summary=event.get('summary', 'No title'),
-                    start=start_dt,
-                    end=end_dt,
-                    location=event.get('location', ''),
-                    description=event.get('description', '')
-                ))
+            # Already ordered by startTime; the sort is a cheap safety net
+            # for all-day events once everything is naive local time
+            calendar_events.sort(key=lambda e: e.start)
 
             self.events_cache = calendar_events
-            self.cache_time = datetime.now()
+            self.cache_time = self._now()
+
+            # Running max of end times, so overlapping events are handled
+            self._sorted_starts = [e.start for e in calendar_events]
+            self._max_ends = list(accumulate((e.end for e in calendar_events), max))
 
             logger.info(f"Retrieved {len(calendar_events)} events for today")
             return calendar_events
 
         except Exception as e:
             logger.error(f"Error fetching today's events: {e}")
-            return []
+            return _FETCH_FAILED
 
     def get_next_event(self) -> Optional[CalendarEvent]:
         """Get the next upcoming event"""
         if not self.enabled:
             return None
 
+        return self._cached(("next",), self._fetch_next_event)
+
+    def _fetch_next_event(self) -> Optional[CalendarEvent]:
+        """Fetch the next upcoming event from the API"""
         try:
-            now = datetime.now()
+            now = self._now()
             events_result = self.service.events().list(
                 calendarId='primary',
                 timeMin=now.isoformat() + 'Z',
                 maxResults=1,
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                fields=_EVENT_FIELDS
             ).execute()
 
             events = events_result.get('items', [])
             if not events:
                 return None
 
-            event = events[0]
-            start = event['start'].get('dateTime', event['start'].get('date'))
-            end = event['end'].get('dateTime', event['end'].get('date'))
-
-            # Parse datetime
-            if 'T' in start:
-                start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-            else:
-                start_dt = datetime.fromisoformat(start)
-                end_dt = datetime.fromisoformat(end)
-
-            return CalendarEvent(
-                summary=event.get('summary', 'No title'),
-                start=start_dt,
-                end=end_dt,
-                location=event.get('location', ''),
-                description=event.get('description', '')
-            )
+            return _parse_event(events[0])
 
         except Exception as e:
             logger.error(f"Error fetching next event: {e}")
-            return None
+            return _FETCH_FAILED
 
     def get_upcoming_events(self, hours: int = 24) -> List[CalendarEvent]:
         """Get events in the next N hours"""
         if not self.enabled:
             return []
 
+        return self._cached(("upcoming", hours), lambda: self._fetch_upcoming_events(hours), default=[])
+
+    def _fetch_upcoming_events(self, hours: int) -> List[CalendarEvent]:
+        """Fetch events in the next N hours from the API"""
         try:
-            now = datetime.now()
+            now = self._now()
             time_max = now + timedelta(hours=hours)
 
             events_result = self.service.events().list(
                 calendarId='primary',
                 timeMin=now.isoformat() + 'Z',
                 timeMax=time_max.isoformat() + 'Z',
+                maxResults=250,
                 singleEvents=True,
-                orderBy='startTime'
+                orderBy='startTime',
+                fields=_EVENT_FIELDS
             ).execute()
 
             events = events_result.get('items', [])
-            calendar_events = []
-
-            for event in events:
-                start = event['start'].get('dateTime', event['start'].get('date'))
-                end = event['end'].get('dateTime', event['end'].get('date'))
-
-                if 'T' in start:
-                    start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                else:
-                    start_dt = datetime.fromisoformat(start)
-                    end_dt = datetime.fromisoformat(end)
-
-                calendar_events.append(CalendarEvent(
-                    summary=event.get('summary', 'No title'),
-                    start=start_dt,
-                    end=end_dt,
-                    location=event.get('location', ''),
-                    description=event.get('description', '')
-                ))
+            calendar_events = [_parse_event(ev) for ev in events]
 
             return calendar_events
 
         except Exception as e:
             logger.error(f"Error fetching upcoming events: {e}")
-            return []
+            return _FETCH_FAILED
 
     def get_events_summary(self) -> str:
         """Get human-readable summary of today's events"""
@@ -253,33 +354,53 @@ class GoogleCalendarService:
         if len(events) == 1:
             return f"You have 1 event today: {events[0]}"
 
-        summary = f"You have {len(events)} events today:\n"
-        for i, event in enumerate(events, 1):
-            time_str = event.start.strftime("%I:%M %p")
-            summary += f"{i}. {event.summary} at {time_str}\n"
-
-        return summary.strip()
+        # Collect lines and join once instead of growing a string
+        parts = [f"You have {len(events)} events today:"]
+        parts.extend(f"{i}. {event}" for i, event in enumerate(events, 1))
+        return "\n".join(parts)
 
     def is_free_at(self, check_time: datetime) -> bool:
         """Check if a specific time is free"""
         if not self.enabled:
             return True  # Assume free if calendar not available
 
-        events = self.get_todays_events()
+        # Refreshes events_cache and the interval index only when stale
+        self.get_todays_events()
 
-        for event in events:
-            if event.start <= check_time < event.end:
-                return False
+        # Last event starting at or before check_time; busy if any event up
+        # to it is still running
+        idx = bisect_right(self._sorted_starts, check_time) - 1
+        return idx < 0 or check_time >= self._max_ends[idx]
 
-        return True
+    def _fetch_today_and_next(self):
+        """
+        Get today's events and the next event from one events().list payload
+
+        Returns:
+            tuple: (today's events, next event or None)
+        """
+        todays_events = self.get_todays_events()
+
+        # First of today's events that has not started yet (starts are sorted)
+        idx = bisect_left(self._sorted_starts, self._now())
+        next_event = todays_events[idx] if idx < len(todays_events) else None
+
+        # Nothing left today, so look further ahead (cached like the rest)
+        if next_event is None:
+            upcoming = self.get_upcoming_events(168)
+            next_event = upcoming[0] if upcoming else None
+
+        return todays_events, next_event
 
     def get_context_string(self) -> str:
         """Get calendar context for AI prompt"""
         if not self.enabled:
             return "Calendar: Not connected"
 
-        next_event = self.get_next_event()
-        todays_events = self.get_todays_events()
+        # One timestamp for cache checks, the next-event lookup and the countdown
+        with self._pinned_now():
+            todays_events, next_event = self._fetch_today_and_next()
+            now = self._now()
 
         if not next_event and not todays_events:
             return "Calendar: No events today"
@@ -290,14 +411,12 @@ class GoogleCalendarService:
             context_parts.append(f"Today's schedule: {len(todays_events)} events")
 
         if next_event:
-            now = datetime.now()
             time_until = next_event.start - now
 
             if time_until.total_seconds() < 3600:  # Less than 1 hour
                 minutes = int(time_until.total_seconds() / 60)
                 context_parts.append(f"Next: '{next_event.summary}' in {minutes} minutes")
             else:
-                time_str = next_event.start.strftime("%I:%M %p")
-                context_parts.append(f"Next: '{next_event.summary}' at {time_str}")
+                context_parts.append(f"Next: '{next_event.summary}' at {next_event.time_str}")
 
         return "Calendar: " + ", ".join(context_parts)
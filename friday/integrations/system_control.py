@@ -2,71 +2,214 @@
 System Control - Control applications, files, and websites
 """
 import os
+import shlex
+import shutil
 import subprocess
 import webbrowser
 import platform
+import re
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import quote_plus
 from typing import Optional, List
 from friday.utils.logger import get_logger
 
 logger = get_logger("system_control")
 
 
+def _build_common_apps(system: str) -> dict:
+    """Get common application paths for the given OS"""
+    if system == "Windows":
+        return {
+            # Browsers
+            "chrome": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+            "firefox": r"C:\Program Files\Mozilla Firefox\firefox.exe",
+            "edge": r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+
+            # Office
+            "word": r"C:\Program Files\Microsoft Office\root\Office16\WINWORD.EXE",
+            "excel": r"C:\Program Files\Microsoft Office\root\Office16\EXCEL.EXE",
+            "powerpoint": r"C:\Program Files\Microsoft Office\root\Office16\POWERPNT.EXE",
+
+            # Communication
+            "discord": os.path.expandvars(r"%LOCALAPPDATA%\Discord\Update.exe"),
+            "slack": os.path.expandvars(r"%LOCALAPPDATA%\slack\slack.exe"),
+            "teams": os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\Teams\current\Teams.exe"),
+
+            # Media
+            "spotify": os.path.expandvars(r"%APPDATA%\Spotify\Spotify.exe"),
+            "vlc": r"C:\Program Files\VideoLAN\VLC\vlc.exe",
+
+            # Development
+            "vscode": os.path.expandvars(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
+            "pycharm": r"C:\Program Files\JetBrains\PyCharm Community Edition 2023.3\bin\pycharm64.exe",
+
+            # System
+            "notepad": "notepad.exe",
+            "calculator": "calc.exe",
+            "explorer": "explorer.exe",
+        }
+    elif system == "Darwin":  # macOS
+        return {
+            "chrome": "/Applications/Google Chrome.app",
+            "firefox": "/Applications/Firefox.app",
+            "safari": "/Applications/Safari.app",
+            "spotify": "/Applications/Spotify.app",
+            "vscode": "/Applications/Visual Studio Code.app",
+        }
+    else:  # Linux
+        return {
+            "chrome": "google-chrome",
+            "firefox": "firefox",
+            "spotify": "spotify",
+            "vscode": "code",
+        }
+
+
+# Resolved once at import; the OS and its app paths do not change at runtime
+_SYSTEM = platform.system()
+_COMMON_APPS = MappingProxyType(_build_common_apps(_SYSTEM))
+
+# Windows: let the Shell resolve app registrations without starting cmd.exe
+if _SYSTEM == "Windows":
+    import ctypes
+    _ShellExecuteW = ctypes.windll.shell32.ShellExecuteW
+else:
+    _ShellExecuteW = None
+
+
+def _shell_open(target: str) -> bool:
+    """
+    Open a file or registered app through ShellExecuteW (Windows only)
+
+    Args:
+        target: App name or path
+
+    Returns:
+        bool: True if the Shell accepted it
+    """
+    if _ShellExecuteW is None:
+        return False
+    # Return values above 32 mean success; SW_SHOWNORMAL = 1
+    return _ShellExecuteW(None, "open", target, None, None, 1) > 32
+
+
+def _spawn(args, **kwargs):
+    """
+    Start a process without waiting for it
+
+    close_fds=False plus an executable path lets CPython use posix_spawn()
+    instead of fork()+exec(), so launch time does not grow with our own
+    memory footprint. Nothing here holds descriptors the child shouldn't see.
+
+    Args:
+        args: Argument list (or command string when shell=True)
+        **kwargs: Extra Popen arguments
+
+    Returns:
+        subprocess.Popen: Started process
+    """
+    if not kwargs.get("shell") and os.name == "posix":
+        # posix_spawn is only taken when the executable has a directory part
+        executable = shutil.which(args[0])
+        if executable:
+            args = [executable, *args[1:]]
+
+    return subprocess.Popen(args, close_fds=False, **kwargs)
+
+
+# Anything a shell would interpret; such commands still go through the shell
+_SHELL_METACHARS = re.compile(r'[|&;<>$`*?()%^"\']')
+
+
+def _run_command_line(command: str):
+    """
+    Run a command line, only paying for a shell when it needs one
+
+    Args:
+        command: Command line as typed
+
+    Returns:
+        subprocess.Popen: Started process
+    """
+    if _SHELL_METACHARS.search(command):
+        return _spawn(command, shell=True)
+
+    if _SYSTEM == "Windows":
+        # Real executables start directly; cmd builtins (dir, start, ...) need cmd.exe
+        program = command.split(None, 1)[0] if command.strip() else ""
+        if program and shutil.which(program):
+            return _spawn(command)
+        return _spawn(command, shell=True)
+
+    return _spawn(shlex.split(command))
+
+
 class SystemControl:
     """System control for opening apps, files, and websites"""
 
     def __init__(self):
-        self.system = platform.system()
+        self.system = _SYSTEM
         self.common_apps = self._get_common_apps()
+
+        # app name -> (path, exists); skips the filesystem stat after first launch
+        self._resolved = {}
+
+        # Launch command for URLs, resolved once (None -> use webbrowser)
+        self._default_browser = self._resolve_default_browser()
+
         logger.info(f"System Control initialized for {self.system}")
 
     def _get_common_apps(self) -> dict:
         """Get common application paths for the current OS"""
-        if self.system == "Windows":
-            return {
-                # Browsers
-                "chrome": r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                "firefox": r"C:\Program Files\Mozilla Firefox\firefox.exe",
-                "edge": r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
-
-                # Office
-                "word": r"C:\Program Files\Microsoft Office\root\Office16\WINWORD.EXE",
-                "excel": r"C:\Program Files\Microsoft Office\root\Office16\EXCEL.EXE",
-                "powerpoint": r"C:\Program Files\Microsoft Office\root\Office16\POWERPNT.EXE",
-
-                # Communication
-                "discord": os.path.expandvars(r"%LOCALAPPDATA%\Discord\Update.exe"),
-                "slack": os.path.expandvars(r"%LOCALAPPDATA%\slack\slack.exe"),
-                "teams": os.path.expandvars(r"%LOCALAPPDATA%\Microsoft\Teams\current\Teams.exe"),
-
-                # Media
-                "spotify": os.path.expandvars(r"%APPDATA%\Spotify\Spotify.exe"),
-                "vlc": r"C:\Program Files\VideoLAN\VLC\vlc.exe",
-
-                # Development
-                "vscode": os.path.expandvars(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
-                "pycharm": r"C:\Program Files\JetBrains\PyCharm Community Edition 2023.3\bin\pycharm64.exe",
-
-                # System
-                "notepad": "notepad.exe",
-                "calculator": "calc.exe",
-                "explorer": "explorer.exe",
-            }
-        elif self.system == "Darwin":  # macOS
-            return {
-                "chrome": "/Applications/Google Chrome.app",
-                "firefox": "/Applications/Firefox.app",
-                "safari": "/Applications/Safari.app",
-                "spotify": "/Applications/Spotify.app",
-                "vscode": "/Applications/Visual Studio Code.app",
-            }
-        else:  # Linux
-            return {
-                "chrome": "google-chrome",
-                "firefox": "firefox",
-                "spotify": "spotify",
-                "vscode": "code",
-            }
+        return _COMMON_APPS
+
+    def invalidate_cache(self):
+        """Forget resolved app paths (e.g. after installing or moving an app)"""
+        self._resolved.clear()
+        self._default_browser = self._resolve_default_browser()
+
+    def _resolve_default_browser(self) -> Optional[List[str]]:
+        """
+        Find an installed browser to open URLs with directly
+
+        Returns:
+            list or None: Command prefix to which the URL is appended
+        """
+        for name in ("chrome", "edge", "firefox"):
+            if name not in self.common_apps:
+                continue
+
+            app_path, exists = self._resolve_app(name)
+
+            if self.system == "Windows":
+                if exists:
+                    return [app_path]
+            elif self.system == "Darwin":  # macOS
+                if exists:
+                    return ["open", "-a", app_path]
+            else:  # Linux
+                executable = shutil.which(app_path)
+                if executable:
+                    return [executable]
+
+        return None
+
+    def _resolve_app(self, app_name: str):
+        """
+        Look up a known app's path and whether it exists on disk
+
+        Args:
+            app_name: Lower-cased app name from common_apps
+
+        Returns:
+            tuple: (app_path, exists)
+        """
+        resolved = self._resolved.get(app_name)
+        if resolved is None:
+            app_path = self.common_apps[app_name]
+            resolved = self._resolved[app_name] = (app_path, os.path.exists(app_path))
+        return resolved
 
     def open_app(self, app_name: str) -> bool:
         """
@@ -83,36 +226,40 @@ class SystemControl:
 
             # Check if it's a known app
             if app_name_lower in self.common_apps:
-                app_path = self.common_apps[app_name_lower]
+                app_path, exists = self._resolve_app(app_name_lower)
 
                 if self.system == "Windows":
                     # Check if file exists
-                    if os.path.exists(app_path):
+                    if exists:
                         os.startfile(app_path)
                         logger.info(f"Opened {app_name} from {app_path}")
                         return True
                     else:
-                        # Try running directly (for system apps)
-                        subprocess.Popen([app_path], shell=True)
+                        # Try running directly (for system apps on PATH or
+                        # registered with the Shell); cmd.exe is the last resort
+                        if shutil.which(app_path):
+                            _spawn([app_path])
+                        elif not _shell_open(app_path):
+                            _spawn([app_path], shell=True)
                         logger.info(f"Launched {app_name}")
                         return True
 
                 elif self.system == "Darwin":  # macOS
-                    subprocess.Popen(["open", app_path])
+                    _spawn(["open", app_path])
                     logger.info(f"Opened {app_name}")
                     return True
 
                 else:  # Linux
-                    subprocess.Popen([app_path])
+                    _spawn([app_path])
                     logger.info(f"Opened {app_name}")
                     return True
 
             else:
                 # Try to run as command
                 if self.system == "Windows":
-                    subprocess.Popen(app_name, shell=True)
+                    _run_command_line(app_name)
                 else:
-                    subprocess.Popen([app_name])
+                    _spawn([app_name])
 
                 logger.info(f"Attempted to launch {app_name} as command")
                 return True
@@ -141,9 +288,9 @@ class SystemControl:
             if self.system == "Windows":
                 os.startfile(str(path))
             elif self.system == "Darwin":  # macOS
-                subprocess.Popen(["open", str(path)])
+                _spawn(["open", str(path)])
             else:  # Linux
-                subprocess.Popen(["xdg-open", str(path)])
+                _spawn(["xdg-open", str(path)])
 
             logger.info(f"Opened file: {file_path}")
             return True
@@ -172,9 +319,9 @@ class SystemControl:
             if self.system == "Windows":
                 os.startfile(str(path))
             elif self.system == "Darwin":  # macOS
-                subprocess.Popen(["open", str(path)])
+                _spawn(["open", str(path)])
             else:  # Linux
-                subprocess.Popen(["xdg-open", str(path)])
+                _spawn(["xdg-open", str(path)])
 
             logger.info(f"Opened folder: {folder_path}")
             return True
@@ -198,7 +345,11 @@ class SystemControl:
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
 
-            webbrowser.open(url)
+            if self._default_browser:
+                # Skip webbrowser's per-call browser discovery
+                _spawn([*self._default_browser, url])
+            else:
+                webbrowser.open(url)
             logger.info(f"Opened URL: {url}")
             return True
 
@@ -217,7 +368,7 @@ class SystemControl:
             bool: True if successful
         """
         try:
-            search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+            search_url = f"https://www.google.com/search?q={quote_plus(query)}"
             return self.open_url(search_url)
 
         except Exception as e:
@@ -235,10 +386,7 @@ class SystemControl:
             bool: True if successful
         """
         try:
-            if self.system == "Windows":
-                subprocess.Popen(command, shell=True)
-            else:
-                subprocess.Popen(command.split())
+            _run_command_line(command)
 
             logger.info(f"Executed command: {command}")
             return True
@@ -2,12 +2,29 @@
 Web Search Integration for Jarvis
 """
 import os
-import requests
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import List, Dict, Optional
 from friday.utils.logger import get_logger
 
+# Optional: faster JSON parsing (both accept the raw response bytes)
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 logger = get_logger("web_search")
 
+# Recent answers are served from memory for this long
+CACHE_MAXSIZE = 128
+CACHE_TTL = 300  # seconds
+
+# Persistent pool for racing search backends (no thread spawn per search)
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="web-search")
+
 
 class SearchResult:
     """Represents a search result"""
@@ -36,6 +53,24 @@ class WebSearchService:
         self.tavily_api_key = os.getenv("TAVILY_API_KEY", "")
         self.serp_api_key = os.getenv("SERPAPI_KEY", "")
 
+        # One keep-alive session so repeated searches skip the TCP/TLS handshake;
+        # created on first use so requests is only imported when needed
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Tavily client built once instead of importing the library per search
+        self._tavily_client = None
+        if self.tavily_api_key:
+            try:
+                import tavily
+                self._tavily_client = tavily.TavilyClient(api_key=self.tavily_api_key)
+            except ImportError:
+                logger.debug("Tavily library not installed")
+
+        # (kind, normalized query, ...) -> (stored_at, result), oldest first
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         logger.info("Web Search service initialized")
 
     def search(self, query: str, max_results: int = 5) -> List[SearchResult]:
@@ -49,22 +84,86 @@ class WebSearchService:
         Returns:
             List of SearchResult objects
         """
-        # Try Tavily first if API key available
-        if self.tavily_api_key:
-            results = self._search_tavily(query, max_results)
-            if results:
-                return results
+        key = ("search", query.strip().lower(), max_results)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug(f"Search cache hit for '{query}'")
+            return list(cached)
+
+        if self._tavily_client is not None:
+            # Race Tavily against DuckDuckGo instead of waiting out Tavily first
+            results = self._search_first_non_empty(query, max_results)
+        else:
+            # DuckDuckGo only (no API key needed)
+            results = self._search_duckduckgo(query, max_results)
+
+        # Empty results are usually errors; don't pin them for the TTL
+        if results:
+            self._cache_put(key, results)
+        return results
+
+    def _search_first_non_empty(self, query: str, max_results: int) -> List[SearchResult]:
+        """
+        Query all backends concurrently and return the first non-empty result
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of SearchResult objects (empty if every backend came up empty)
+        """
+        pending = {
+            _EXECUTOR.submit(self._search_tavily, query, max_results),
+            _EXECUTOR.submit(self._search_duckduckgo, query, max_results),
+        }
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results = future.result()  # backends log and return [] on error
+                if results:
+                    for loser in pending:
+                        loser.cancel()
+                    return results
 
-        # Fall back to DuckDuckGo (no API key needed)
-        return self._search_duckduckgo(query, max_results)
+        return []
+
+    def _cache_get(self, key):
+        """
+        Look up a fresh cached result
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at >= CACHE_TTL:
+                del self._cache[key]
+                return None
+
+            self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key, value):
+        """Store a result, evicting the least recently used entry if full"""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
 
     def _search_tavily(self, query: str, max_results: int) -> List[SearchResult]:
         """Search using Tavily API"""
         try:
-            import tavily
-            client = tavily.TavilyClient(api_key=self.tavily_api_key)
-
-            response = client.search(query=query, max_results=max_results)
+            response = self._tavily_client.search(query=query, max_results=max_results)
 
             results = []
             for item in response.get('results', []):
@@ -77,13 +176,31 @@ class WebSearchService:
             logger.info(f"Tavily search: found {len(results)} results for '{query}'")
             return results
 
-        except ImportError:
-            logger.debug("Tavily library not installed")
-            return []
         except Exception as e:
             logger.error(f"Tavily search error: {e}")
             return []
 
+    def _get_session(self):
+        """
+        Get the shared HTTP session, creating it on first use
+
+        Returns:
+            requests.Session: Keep-alive session
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+                    session.headers.update({"User-Agent": "Friday/1.0"})
+                    atexit.register(session.close)
+                    self._session = session
+
+        return self._session
+
     def _search_duckduckgo(self, query: str, max_results: int) -> List[SearchResult]:
         """Search using DuckDuckGo (no API key needed)"""
         try:
@@ -97,8 +214,8 @@ class WebSearchService:
                 "skip_disambig": 1
             }
 
-            response = requests.get(url, params=params, timeout=5)
-            data = response.json()
+            response = self._get_session().get(url, params=params, timeout=5)
+            data = _loads(response.content)
 
             results = []
 
@@ -144,10 +261,7 @@ class WebSearchService:
 
         # If no AI client, return plain text results
         if not openai_client:
-            output = f"Search results for '{query}':\n\n"
-            for i, result in enumerate(results, 1):
-                output += f"{i}. {result.title}\n{result.snippet[:200]}...\n\n"
-            return output.strip()
+            return self._format_results(query, results, 200)
 
         # Use AI to summarize
         try:
@@ -171,10 +285,27 @@ ONE SENTENCE summary:"""
         except Exception as e:
             logger.error(f"Error summarizing results: {e}")
             # Fall back to plain text
-            output = f"Search results for '{query}':\n\n"
-            for i, result in enumerate(results, 1):
-                output += f"{i}. {result.title}\n{result.snippet[:150]}...\n\n"
-            return output.strip()
+            return self._format_results(query, results, 150)
+
+    @staticmethod
+    def _format_results(query: str, results: List[SearchResult], snippet_width: int) -> str:
+        """
+        Render results as plain text
+
+        Args:
+            query: Search query
+            results: Results to list
+            snippet_width: Characters of each snippet to include
+
+        Returns:
+            Numbered results under a header
+        """
+        parts = [f"Search results for '{query}':\n\n"]
+        parts.extend(
+            f"{i}. {result.title}\n{result.snippet[:snippet_width]}...\n\n"
+            for i, result in enumerate(results, 1)
+        )
+        return "".join(parts).strip()
 
     def get_quick_answer(self, query: str) -> Optional[str]:
         """
@@ -186,6 +317,11 @@ ONE SENTENCE summary:"""
         Returns:
             Quick answer string or None
         """
+        key = ("answer", query.strip().lower())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             # Use DuckDuckGo instant answer
             url = "https://api.duckduckgo.com/"
@@ -196,18 +332,23 @@ ONE SENTENCE summary:"""
                 "no_html": 1
             }
 
-            response = requests.get(url, params=params, timeout=5)
-            data = response.json()
+            response = self._get_session().get(url, params=params, timeout=5)
+            data = _loads(response.content)
 
             # Check for instant answer
-            if data.get('Answer'):
-                return data['Answer']
+            answer = data.get('Answer') or data.get('Abstract')
+            if not answer:
+                return None
 
-            if data.get('Abstract'):
-                return data['Abstract']
-
-            return None
+            self._cache_put(key, answer)
+            return answer
 
         except Exception as e:
             logger.error(f"Quick answer error: {e}")
             return None
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
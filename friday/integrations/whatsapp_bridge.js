@@ -34,6 +34,37 @@ let clientReady = false;
 let qrCode = null;
 let newMessages = [];
 
+// Open /messages/stream responses; messages go straight to these and are
+// only buffered in newMessages while nobody is listening
+const streamClients = new Set();
+
+// Comment frames keep idle streams alive past the client's read timeout
+const HEARTBEAT_MS = 15000;
+setInterval(() => {
+    for (const res of [...streamClients]) {
+        if (res.writableEnded || res.destroyed) {
+            streamClients.delete(res);
+            continue;
+        }
+        res.write(': ping\n\n');
+    }
+}, HEARTBEAT_MS);
+
+// Returns false if the stream is already dead, so the caller can buffer instead
+function writeEvent(res, messageData) {
+    if (res.writableEnded || res.destroyed) {
+        streamClients.delete(res);
+        return false;
+    }
+    try {
+        res.write(`data: ${JSON.stringify(messageData)}\n\n`);
+        return true;
+    } catch (error) {
+        streamClients.delete(res);
+        return false;
+    }
+}
+
 // QR Code event
 client.on('qr', (qr) => {
     console.log('[BRIDGE] QR Code received');
@@ -94,6 +125,18 @@ client.on('message', async (msg) => {
             };
 
             console.log(`[BRIDGE] New message from ${messageData.senderName}: ${msg.body}`);
+
+            // Buffer unless at least one live stream took the message
+            let delivered = false;
+            for (const res of [...streamClients]) {
+                if (writeEvent(res, messageData)) {
+                    delivered = true;
+                }
+            }
+            if (delivered) {
+                return;
+            }
+
             newMessages.push(messageData);
 
             // Keep only last 100 messages in memory
@@ -149,6 +192,35 @@ app.get('/messages/new', (req, res) => {
     });
 });
 
+// Stream new messages as Server-Sent Events
+app.get('/messages/stream', (req, res) => {
+    res.writeHead(200, {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        'Connection': 'keep-alive'
+    });
+    res.flushHeaders();
+
+    // Hand over whatever arrived while no client was connected
+    const pending = newMessages;
+    newMessages = [];
+    for (let i = 0; i < pending.length; i++) {
+        if (!writeEvent(res, pending[i])) {
+            // Stream died during the handover; keep the rest for the next client
+            newMessages = pending.slice(i).concat(newMessages);
+            return;
+        }
+    }
+
+    streamClients.add(res);
+    req.on('close', () => {
+        streamClients.delete(res);
+    });
+    res.on('error', () => {
+        streamClients.delete(res);
+    });
+});
+
 // Send message
 app.post('/messages/send', async (req, res) => {
     try {
@@ -177,6 +249,46 @@ app.post('/messages/send', async (req, res) => {
     }
 });
 
+// Send several messages in one request (sent in order, one result per message)
+app.post('/messages/send_batch', async (req, res) => {
+    try {
+        if (!clientReady) {
+            return res.status(503).json({ error: 'Client not ready' });
+        }
+
+        const { messages } = req.body;
+
+        if (!Array.isArray(messages)) {
+            return res.status(400).json({ error: 'messages array is required' });
+        }
+
+        const results = [];
+        for (const { chatId, message } of messages) {
+            if (!chatId || !message) {
+                results.push({ chatId: chatId, success: false, error: 'chatId and message are required' });
+                continue;
+            }
+
+            try {
+                const formattedChatId = chatId.includes('@') ? chatId : `${chatId}@c.us`;
+                const result = await client.sendMessage(formattedChatId, message);
+                results.push({ chatId: chatId, success: true, messageId: result.id._serialized });
+            } catch (error) {
+                console.error('[BRIDGE] Error sending batched message:', error);
+                results.push({ chatId: chatId, success: false, error: error.message });
+            }
+        }
+
+        res.json({
+            count: results.length,
+            results: results
+        });
+    } catch (error) {
+        console.error('[BRIDGE] Error sending message batch:', error);
+        res.status(500).json({ error: error.message });
+    }
+});
+
 // Get all chats
 app.get('/chats', async (req, res) => {
     try {
@@ -276,7 +388,9 @@ app.listen(PORT, '127.0.0.1', () => {
     console.log('  GET  /health');
     console.log('  GET  /status');
     console.log('  GET  /messages/new');
+    console.log('  GET  /messages/stream');
     console.log('  POST /messages/send');
+    console.log('  POST /messages/send_batch');
     console.log('  GET  /chats');
     console.log('  GET  /chats/:chatId/messages');
     console.log('  POST /contacts/search');
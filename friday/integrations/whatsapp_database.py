@@ -4,18 +4,30 @@ WhatsApp chat history storage and retrieval
 
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict
 from datetime import datetime, timedelta
 from friday.integrations.whatsapp_models import WhatsAppMessage, WhatsAppContact, WhatsAppChat, MessageDirection, MessageType
 from friday.utils.logger import get_logger
 
 logger = get_logger("whatsapp_db")
 
+# Direct value -> member lookups for row conversion (skips Enum.__call__)
+_DIR_MAP = MessageDirection._value2member_map_
+_TYPE_MAP = MessageType._value2member_map_
+_ISO = datetime.fromisoformat
+
 
 class WhatsAppDatabase:
     """SQLite database for storing WhatsApp chat history"""
 
+    # Hot-path statements kept as constants so the connection's statement
+    # cache sees the identical SQL string every call
+    _MARK_MESSAGE_READ_SQL = "UPDATE messages SET is_read = 1 WHERE id = ?"
+    _MARK_CHAT_READ_SQL = "UPDATE messages SET is_read = 1 WHERE chat_name = ? AND is_from_me = 0"
+
     def __init__(self, db_path: Optional[Path] = None):
         if db_path is None:
             db_path = Path.home() / "AppData" / "Local" / "Friday" / "whatsapp_history.db"
@@ -23,13 +35,28 @@ class WhatsAppDatabase:
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path
         self.conn = None
+        self._tx_depth = 0  # Nesting level of transaction() blocks
+        self._tx_lock = threading.RLock()  # One writer transaction at a time
         self._initialize_db()
 
     def _initialize_db(self):
         """Create database tables if they don't exist"""
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        # Autocommit mode: single statements commit on their own, and write
+        # bursts are grouped explicitly with transaction()
+        self.conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
         self.conn.row_factory = sqlite3.Row
 
+        # WAL + NORMAL: commits append to the log instead of fsyncing the main file
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+
         cursor = self.conn.cursor()
 
         # Contacts table
@@ -63,11 +90,108 @@ class WhatsAppDatabase:
         # Create indexes for faster queries
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_chat_timestamp ON messages(chat_name, timestamp DESC)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON messages(timestamp DESC)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_unread ON messages(is_read, is_from_me)")
 
-        self.conn.commit()
+        # Unread lookups: a partial index holds only unread incoming rows,
+        # already in the order get_unread_messages returns them
+        new_unread_index = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_unread_partial'"
+        ).fetchone() is None
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_unread_partial ON messages(timestamp DESC)
+            WHERE is_read = 0 AND is_from_me = 0
+        """)
+        cursor.execute("DROP INDEX IF EXISTS idx_unread")  # two-value columns, barely selective
+
+        # Refresh planner statistics once, when the index first appears
+        if new_unread_index:
+            cursor.execute("ANALYZE")
+
+        # Full-text index over message content
+        self._fts_enabled = self._initialize_fts(cursor)
         logger.info(f"WhatsApp database initialized at {self.db_path}")
 
+    def _initialize_fts(self, cursor) -> bool:
+        """
+        Create the FTS5 index mirroring messages.content
+
+        Returns:
+            bool: True if full-text search is available
+        """
+        try:
+            # INSERT OR REPLACE deletes the old row; without this the delete
+            # trigger would not fire and the index would keep stale entries
+            cursor.execute("PRAGMA recursive_triggers=ON")
+
+            exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'messages_fts'"
+            ).fetchone()
+
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+                    id UNINDEXED, content, content='messages', content_rowid='rowid'
+                )
+            """)
+
+            # Keep the index in sync with the messages table
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+                    INSERT INTO messages_fts(rowid, id, content) VALUES (new.rowid, new.id, new.content);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+                    INSERT INTO messages_fts(messages_fts, rowid, id, content)
+                    VALUES ('delete', old.rowid, old.id, old.content);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF content ON messages BEGIN
+                    INSERT INTO messages_fts(messages_fts, rowid, id, content)
+                    VALUES ('delete', old.rowid, old.id, old.content);
+                    INSERT INTO messages_fts(rowid, id, content) VALUES (new.rowid, new.id, new.content);
+                END
+            """)
+
+            # Index messages stored before the FTS table existed
+            if not exists:
+                cursor.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+
+            return True
+
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, message search will scan: {e}")
+            return False
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one commit
+
+        Example:
+            with db.transaction():
+                db.save_contact(contact)
+                db.mark_chat_read(contact.name)
+
+        The outermost block takes the write lock up front (BEGIN IMMEDIATE),
+        commits on success and rolls back if an exception escapes; nested
+        blocks join it.
+        """
+        with self._tx_lock:
+            if self._tx_depth == 0:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.execute("COMMIT")
+
     def save_contact(self, contact: WhatsAppContact):
         """Save or update a contact"""
         cursor = self.conn.cursor()
@@ -81,150 +205,172 @@ class WhatsAppDatabase:
             contact.last_seen.isoformat() if contact.last_seen else None,
             contact.profile_pic_url
         ))
-        self.conn.commit()
 
     def save_message(self, message: WhatsAppMessage):
         """Save a message to the database"""
+        self.save_messages([message])
+
+    def save_messages(self, messages: List[WhatsAppMessage]):
+        """Save several messages in one transaction (one commit for the batch)"""
+        rows = [
+            (
+                message.id,
+                message.chat_name,
+                message.sender_name,
+                message.content,
+                message.timestamp.isoformat(),
+                message.direction.value,
+                message.message_type.value,
+                message.media_path,
+                1 if message.is_read else 0,
+                1 if message.is_from_me else 0
+            )
+            for message in messages
+        ]
+
+        # One transaction for the batch; autocommit would commit per row
+        with self.transaction():
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO messages
+                (id, chat_name, sender_name, content, timestamp, direction, message_type, media_path, is_read, is_from_me)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+
+    def _iter_messages(self, sql: str, params: tuple = ()) -> Iterator[WhatsAppMessage]:
+        """
+        Run a query and convert rows to messages as they are read
+
+        The query runs immediately (so SQL errors surface here); rows are
+        pulled from SQLite in batches instead of materialized with fetchall.
+        """
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO messages
-            (id, chat_name, sender_name, content, timestamp, direction, message_type, media_path, is_read, is_from_me)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            message.id,
-            message.chat_name,
-            message.sender_name,
-            message.content,
-            message.timestamp.isoformat(),
-            message.direction.value,
-            message.message_type.value,
-            message.media_path,
-            1 if message.is_read else 0,
-            1 if message.is_from_me else 0
-        ))
-        self.conn.commit()
-
-    def get_messages_by_chat(self, chat_name: str, limit: int = 100) -> List[WhatsAppMessage]:
-        """Get messages from a specific chat"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        cursor.arraysize = 200
+        cursor.execute(sql, params)
+        row_to_message = self._row_to_message
+        return (row_to_message(row) for row in cursor)
+
+    def iter_messages_by_chat(self, chat_name: str, limit: int = 100) -> Iterator[WhatsAppMessage]:
+        """Iterate messages from a specific chat, newest first"""
+        return self._iter_messages("""
             SELECT * FROM messages
             WHERE chat_name = ?
             ORDER BY timestamp DESC
             LIMIT ?
         """, (chat_name, limit))
 
-        messages = []
-        for row in cursor.fetchall():
-            messages.append(self._row_to_message(row))
-
-        return messages
+    def get_messages_by_chat(self, chat_name: str, limit: int = 100) -> List[WhatsAppMessage]:
+        """Get messages from a specific chat"""
+        return list(self.iter_messages_by_chat(chat_name, limit))
 
-    def get_recent_messages(self, limit: int = 50) -> List[WhatsAppMessage]:
-        """Get most recent messages across all chats"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+    def iter_recent_messages(self, limit: int = 50) -> Iterator[WhatsAppMessage]:
+        """Iterate most recent messages across all chats"""
+        return self._iter_messages("""
             SELECT * FROM messages
             ORDER BY timestamp DESC
             LIMIT ?
         """, (limit,))
 
-        messages = []
-        for row in cursor.fetchall():
-            messages.append(self._row_to_message(row))
-
-        return messages
+    def get_recent_messages(self, limit: int = 50) -> List[WhatsAppMessage]:
+        """Get most recent messages across all chats"""
+        return list(self.iter_recent_messages(limit))
 
-    def get_unread_messages(self) -> List[WhatsAppMessage]:
-        """Get all unread messages"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+    def iter_unread_messages(self) -> Iterator[WhatsAppMessage]:
+        """Iterate all unread messages, newest first"""
+        return self._iter_messages("""
             SELECT * FROM messages
             WHERE is_read = 0 AND is_from_me = 0
             ORDER BY timestamp DESC
         """)
 
-        messages = []
-        for row in cursor.fetchall():
-            messages.append(self._row_to_message(row))
-
-        return messages
+    def get_unread_messages(self) -> List[WhatsAppMessage]:
+        """Get all unread messages"""
+        return list(self.iter_unread_messages())
 
     def mark_message_read(self, message_id: str):
         """Mark a specific message as read"""
-        cursor = self.conn.cursor()
-        cursor.execute("UPDATE messages SET is_read = 1 WHERE id = ?", (message_id,))
-        self.conn.commit()
+        with self._tx_lock:  # autocommit, but never inside another thread's transaction
+            self.conn.execute(self._MARK_MESSAGE_READ_SQL, (message_id,))
 
     def mark_chat_read(self, chat_name: str):
         """Mark all messages in a chat as read"""
-        cursor = self.conn.cursor()
-        cursor.execute("UPDATE messages SET is_read = 1 WHERE chat_name = ? AND is_from_me = 0", (chat_name,))
-        self.conn.commit()
-
-    def search_messages(self, query: str, limit: int = 50) -> List[WhatsAppMessage]:
-        """Search messages by content"""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        with self._tx_lock:  # autocommit, but never inside another thread's transaction
+            self.conn.execute(self._MARK_CHAT_READ_SQL, (chat_name,))
+
+    def mark_chats_read(self, chat_names: List[str]):
+        """Mark all messages in several chats as read with one commit"""
+        with self.transaction():
+            self.conn.executemany(self._MARK_CHAT_READ_SQL, [(name,) for name in chat_names])
+
+    def iter_search_messages(self, query: str, limit: int = 50) -> Iterator[WhatsAppMessage]:
+        """Iterate messages matching a content search, newest first"""
+        match = self._fts_query(query) if self._fts_enabled else None
+        if match:
+            try:
+                return self._iter_messages("""
+                    SELECT m.* FROM messages_fts f
+                    JOIN messages m ON m.rowid = f.rowid
+                    WHERE messages_fts MATCH ?
+                    ORDER BY m.timestamp DESC
+                    LIMIT ?
+                """, (match, limit))
+
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS search failed, falling back to LIKE: {e}")
+
+        return self._iter_messages("""
             SELECT * FROM messages
             WHERE content LIKE ?
             ORDER BY timestamp DESC
             LIMIT ?
         """, (f"%{query}%", limit))
 
-        messages = []
-        for row in cursor.fetchall():
-            messages.append(self._row_to_message(row))
-
-        return messages
+    def search_messages(self, query: str, limit: int = 50) -> List[WhatsAppMessage]:
+        """Search messages by content"""
+        return list(self.iter_search_messages(query, limit))
 
-    def get_messages_by_date(self, date: datetime, chat_name: Optional[str] = None) -> List[WhatsAppMessage]:
-        """Get messages from a specific date"""
+    def iter_messages_by_date(self, date: datetime, chat_name: Optional[str] = None) -> Iterator[WhatsAppMessage]:
+        """Iterate messages from a specific date, oldest first"""
         start_date = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_date = start_date + timedelta(days=1)
 
-        cursor = self.conn.cursor()
         if chat_name:
-            cursor.execute("""
+            return self._iter_messages("""
                 SELECT * FROM messages
                 WHERE chat_name = ? AND timestamp >= ? AND timestamp < ?
                 ORDER BY timestamp ASC
             """, (chat_name, start_date.isoformat(), end_date.isoformat()))
-        else:
-            cursor.execute("""
-                SELECT * FROM messages
-                WHERE timestamp >= ? AND timestamp < ?
-                ORDER BY timestamp ASC
-            """, (start_date.isoformat(), end_date.isoformat()))
 
-        messages = []
-        for row in cursor.fetchall():
-            messages.append(self._row_to_message(row))
+        return self._iter_messages("""
+            SELECT * FROM messages
+            WHERE timestamp >= ? AND timestamp < ?
+            ORDER BY timestamp ASC
+        """, (start_date.isoformat(), end_date.isoformat()))
 
-        return messages
+    def get_messages_by_date(self, date: datetime, chat_name: Optional[str] = None) -> List[WhatsAppMessage]:
+        """Get messages from a specific date"""
+        return list(self.iter_messages_by_date(date, chat_name))
 
     def get_chat_statistics(self, chat_name: str) -> Dict:
         """Get statistics for a specific chat"""
         cursor = self.conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) as total FROM messages WHERE chat_name = ?", (chat_name,))
-        total = cursor.fetchone()['total']
-
-        cursor.execute("SELECT COUNT(*) as sent FROM messages WHERE chat_name = ? AND is_from_me = 1", (chat_name,))
-        sent = cursor.fetchone()['sent']
-
-        cursor.execute("SELECT COUNT(*) as received FROM messages WHERE chat_name = ? AND is_from_me = 0", (chat_name,))
-        received = cursor.fetchone()['received']
-
-        cursor.execute("SELECT MIN(timestamp) as first_msg FROM messages WHERE chat_name = ?", (chat_name,))
-        first_msg = cursor.fetchone()['first_msg']
+        # All four figures in one pass over the chat's rows
+        cursor.execute("""
+            SELECT COUNT(*) AS total,
+                   COALESCE(SUM(is_from_me = 1), 0) AS sent,
+                   COALESCE(SUM(is_from_me = 0), 0) AS received,
+                   MIN(timestamp) AS first_msg
+            FROM messages
+            WHERE chat_name = ?
+        """, (chat_name,))
+        row = cursor.fetchone()
 
         return {
             'chat_name': chat_name,
-            'total_messages': total,
-            'sent': sent,
-            'received': received,
-            'first_message': first_msg
+            'total_messages': row['total'],
+            'sent': row['sent'],
+            'received': row['received'],
+            'first_message': row['first_msg']
         }
 
     def get_all_chats(self) -> List[str]:
@@ -233,6 +379,17 @@ class WhatsAppDatabase:
         cursor.execute("SELECT DISTINCT chat_name FROM messages ORDER BY chat_name")
         return [row['chat_name'] for row in cursor.fetchall()]
 
+    @staticmethod
+    def _fts_query(query: str) -> Optional[str]:
+        """
+        Turn free text into an FTS5 query that matches every word as a prefix
+
+        Each word is quoted so FTS operators and punctuation in the user's
+        text are taken literally.
+        """
+        terms = ['"' + word.replace('"', '""') + '"*' for word in query.split()]
+        return " ".join(terms) if terms else None
+
     def _row_to_message(self, row: sqlite3.Row) -> WhatsAppMessage:
         """Convert database row to WhatsAppMessage object"""
         return WhatsAppMessage(
@@ -240,9 +397,9 @@ class WhatsAppDatabase:
             chat_name=row['chat_name'],
             sender_name=row['sender_name'],
             content=row['content'],
-            timestamp=datetime.fromisoformat(row['timestamp']),
-            direction=MessageDirection(row['direction']),
-            message_type=MessageType(row['message_type']),
+            timestamp=_ISO(row['timestamp']),
+            direction=_DIR_MAP[row['direction']],
+            message_type=_TYPE_MAP[row['message_type']],
             media_path=row['media_path'],
             is_read=bool(row['is_read']),
             is_from_me=bool(row['is_from_me'])
@@ -251,9 +408,18 @@ class WhatsAppDatabase:
     def close(self):
         """Close database connection"""
         if self.conn:
+            try:
+                # Fold the WAL back into the main file so nothing is left to replay
+                self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"WAL checkpoint failed: {e}")
+
             self.conn.close()
+            self.conn = None
             logger.info("WhatsApp database connection closed")
 
-    def __del__(self):
-        """Cleanup on deletion"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close()
@@ -2,6 +2,7 @@
 Data models for WhatsApp integration
 """
 
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
@@ -25,7 +26,7 @@ class MessageDirection(Enum):
     OUTGOING = "outgoing"
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppMessage:
     """Represents a WhatsApp message"""
     id: str
@@ -38,6 +39,7 @@ class WhatsAppMessage:
     media_path: Optional[str] = None
     is_read: bool = False
     is_from_me: bool = False
+    from_id: Optional[str] = None  # Sender's WhatsApp ID (webjs bridge only, not stored)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage"""
@@ -71,7 +73,7 @@ class WhatsAppMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppContact:
     """Represents a WhatsApp contact"""
     name: str
@@ -90,7 +92,7 @@ class WhatsAppContact:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppChat:
     """Represents a WhatsApp chat conversation"""
     contact: WhatsAppContact
@@ -116,7 +118,8 @@ class WhatsAppChat:
 
     def get_recent_messages(self, count: int = 10) -> List[WhatsAppMessage]:
         """Get the most recent messages"""
-        return sorted(self.messages, key=lambda m: m.timestamp, reverse=True)[:count]
+        # Top-k selection; same result as a full reverse sort, sliced
+        return heapq.nlargest(count, self.messages, key=lambda m: m.timestamp)
 
     def to_dict(self) -> dict:
         return {
@@ -129,7 +132,7 @@ class WhatsAppChat:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatsAppNotification:
     """Represents a notification for a new WhatsApp message"""
     chat_name: str
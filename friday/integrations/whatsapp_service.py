@@ -2,11 +2,14 @@
 WhatsApp Web integration service using Selenium
 """
 
+import hashlib
+import itertools
+import re
 import time
 import uuid
+from collections import OrderedDict, deque
 from pathlib import Path
-from queue import Queue
-from threading import Thread, Event, Lock
+from threading import Thread, Event, Lock, RLock, Condition
 from typing import List, Optional, Callable, Dict
 from datetime import datetime
 
@@ -17,7 +20,6 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
-    StaleElementReferenceException,
     WebDriverException
 )
 
@@ -34,6 +36,258 @@ from friday.config import Config
 
 logger = get_logger("whatsapp")
 
+# Selectors reused on every scan, built once
+_SEL_CHAT_LIST = (By.CSS_SELECTOR, '[data-testid="chat-list"]')
+_SEL_CONV_PANEL = (By.CSS_SELECTOR, '[data-testid="conversation-panel-wrapper"]')
+_SEL_PANE_SIDE = (By.XPATH, '//div[@id="pane-side"]')
+_SEL_CHAT_TESTID = (By.CSS_SELECTOR, 'div[data-testid="chat"]')
+_SEL_MSG_CONTAINER = (By.CSS_SELECTOR, '[data-testid="conversation-panel-messages"]')
+_SEL_SEARCH_BOX = (By.CSS_SELECTOR, 'div[contenteditable="true"][data-tab="3"]')
+_SEL_MESSAGE_BOX = (By.CSS_SELECTOR, 'div[contenteditable="true"][data-tab="10"]')
+_SEL_CHAT_HEADER = (By.CSS_SELECTOR, '#main header')
+_SEL_PHONE_DISCONNECTED = (By.XPATH, '//*[contains(text(), "Phone not connected")]')
+
+# Wait conditions for fixed locators (stateless, so one instance serves every call)
+_EC_MSG_CONTAINER = EC.presence_of_element_located(_SEL_MSG_CONTAINER)
+_EC_SEARCH_BOX = EC.presence_of_element_located(_SEL_SEARCH_BOX)
+_EC_MESSAGE_BOX = EC.presence_of_element_located(_SEL_MESSAGE_BOX)
+
+
+def _chat_list_loaded(driver):
+    """WebDriverWait condition: any element that only exists once logged in"""
+    return (
+        driver.find_elements(*_SEL_CHAT_LIST) or
+        driver.find_elements(*_SEL_CONV_PANEL) or
+        driver.find_elements(*_SEL_PANE_SIDE) or
+        driver.find_elements(*_SEL_CHAT_TESTID)
+    )
+
+
+# Bubble prefix such as "[12:34, 11/5/2024] Alice: " or "[9:05 PM, 5/11/24] Bob: "
+_TS_RE = re.compile(
+    r'\[(\d{1,2}):(\d{2})(?:\s*([AaPp])\.?\s*[Mm]\.?)?,\s*(\d{1,2})[/.](\d{1,2})[/.](\d{2,4})\]'
+)
+
+
+def _parse_pre_plain_text(pre: Optional[str], now: datetime) -> Optional[datetime]:
+    """
+    Parse the send time out of a message bubble's data-pre-plain-text
+
+    Args:
+        pre: Attribute value (None when the bubble has none)
+        now: Current time, used to pick between day/month orders
+
+    Returns:
+        Message time, or None if the prefix can't be parsed
+    """
+    if not pre:
+        return None
+
+    match = _TS_RE.match(pre)
+    if not match:
+        return None
+
+    hour, minute, meridiem, first, second, year = match.groups()
+    hour, minute, first, second, year = int(hour), int(minute), int(first), int(second), int(year)
+    if year < 100:
+        year += 2000
+    if meridiem:
+        hour = hour % 12 + (12 if meridiem in 'Pp' else 0)
+
+    # Locale decides M/D vs D/M; keep the reading that isn't in the future and is closest to now
+    candidates = []
+    for month, day in ((first, second), (second, first)):
+        try:
+            candidates.append(datetime(year, month, day, hour, minute))
+        except ValueError:
+            continue
+
+    past = [c for c in candidates if c <= now]
+    if past:
+        return max(past)
+    return min(candidates) if candidates else None
+
+
+# Text stored for bubbles with no selectable text (media, stickers, ...)
+_MEDIA_PLACEHOLDER = "[Media or unsupported message]"
+
+# Messages remembered for dedup before the oldest are forgotten
+_SEEN_MAX = 4096
+
+
+def _seen_key(chat_name: str, record: dict, now: datetime) -> Optional[tuple]:
+    """
+    Dedup key for a message record from the open chat
+
+    Args:
+        chat_name: Chat the record was read from
+        record: Message record from the read helper
+        now: Scan time, passed through to the timestamp parser
+
+    Returns:
+        (chat, sender, send time, 8-byte content digest). Bubbles with
+        no parsable prefix (media, stickers, voice notes) are keyed by
+        their row id instead; None when they have neither, so they are
+        never deduped against each other
+    """
+    sent_at = _parse_pre_plain_text(record['pre'], now)
+    if sent_at is None:
+        row_id = record.get('id')
+        return (chat_name, row_id) if row_id else None
+
+    text = record['text'] if record['text'] is not None else _MEDIA_PLACEHOLDER
+    return (
+        chat_name,
+        "Me" if record['fromMe'] else record['sender'],
+        int(sent_at.timestamp()),
+        hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    )
+
+
+# Records chat list mutations in the page so the monitor can block until
+# something changes instead of scanning on a timer (idempotent per page load)
+_JS_INSTALL_OBSERVER = """
+(() => {
+    if (window.__wa_observer) return true;
+    const pane = document.querySelector('#pane-side');
+    if (!pane) return false;
+    window.__wa_mutations = [];
+    window.__wa_observer = new MutationObserver(() => {
+        if (window.__wa_mutations.length < 1000) window.__wa_mutations.push(Date.now());
+    });
+    window.__wa_observer.observe(pane, {
+        childList: true, subtree: true, characterData: true,
+        attributes: true, attributeFilter: ['class']
+    });
+    return true;
+})()
+"""
+
+# -2 while the page is still loading, -1 when the observer is gone (page
+# reloaded), else the pending mutation count
+_JS_PENDING_MUTATIONS = """
+if (document.readyState !== 'complete') return -2;
+return window.__wa_mutations === undefined ? -1 : window.__wa_mutations.length;
+"""
+_JS_DRAIN_MUTATIONS = "return window.__wa_mutations ? window.__wa_mutations.splice(0).length : 0"
+
+# Longest the monitor blocks waiting for a mutation before re-checking state
+MUTATION_WAIT_TIMEOUT = 30
+
+# Seconds between fallback rescans while the mutation observer can't be installed
+OBSERVER_RETRY_INTERVAL = 10
+
+# Chat list helpers defined once per document (re-injected on every load via CDP)
+# so each scan ships a one-line call instead of the whole script
+_JS_CHAT_HELPERS = """
+(() => {
+    if (window.__wa_scanChats) return true;
+
+    // Chat list items, trying the same selector fallbacks in order
+    window.__wa_chatItems = () => {
+        let items = document.querySelectorAll('div[role="listitem"]');
+        if (!items.length) items = document.querySelectorAll('[data-testid="chat"]');
+        if (!items.length) items = document.querySelectorAll('._3m_Xw');
+        if (!items.length) items = document.querySelectorAll('#pane-side div[class*="chat"]');
+        return Array.from(items);
+    };
+
+    // Name, preview and unread state of the first n chats
+    window.__wa_scanChats = (n) => window.__wa_chatItems().slice(0, n).map((c, index) => {
+        const title = c.querySelector('span[dir="auto"][title]') || c.querySelector('span[title]');
+
+        let preview = c.querySelector('span[dir="ltr"]');
+        preview = preview ? preview.innerText.trim() : '';
+        if (!preview) {
+            // Any span with meaningful text
+            for (const span of c.querySelectorAll('span')) {
+                const text = span.innerText.trim();
+                if (text.length > 5) { preview = text; break; }
+            }
+        }
+
+        // Unread badge, or bold chat title
+        const badge = c.querySelector('span[data-testid="icon-unread"], span[aria-label*="unread"]');
+        const bold = c.querySelector('span[title][dir="auto"]');
+        const hasUnread = !!badge || (!!bold && parseInt(getComputedStyle(bold).fontWeight) >= 600);
+
+        return {index: index, name: title ? title.getAttribute('title') : null, preview: preview, hasUnread: hasUnread};
+    });
+
+    // Direction, text, time, sender and row id of the last n messages in the open chat
+    window.__wa_readMessages = (n) => {
+        const container = document.querySelector('[data-testid="conversation-panel-messages"]');
+        if (!container) return null;
+        const all = container.querySelectorAll('div[data-testid="msg-container"]');
+        return Array.from(all).slice(-n).map(m => {
+            const text = m.querySelector('span.selectable-text');
+            const time = m.querySelector('span[data-testid="msg-time"]');
+            const sender = m.querySelector('span[dir="auto"][role="button"]');
+            const pre = m.querySelector('[data-pre-plain-text]');
+            const row = m.closest('[data-id]');
+            return {
+                fromMe: (m.getAttribute('class') || '').includes('message-out'),
+                text: text ? text.innerText : null,
+                time: time ? time.innerText : null,
+                sender: sender ? sender.innerText : null,
+                pre: pre ? pre.getAttribute('data-pre-plain-text') : null,
+                id: row ? row.getAttribute('data-id') : null
+            };
+        });
+    };
+
+    return true;
+})()
+"""
+
+# null when the helpers are missing from the page, else the chat records
+_JS_SCAN_CHATS = "return window.__wa_scanChats ? window.__wa_scanChats(arguments[0]) : null"
+
+# null when the open chat has no message panel, else the message records
+_JS_READ_MESSAGES = "return window.__wa_readMessages ? window.__wa_readMessages(arguments[0]) : null"
+
+# Title of the chat open in the conversation panel, null when none is open
+_JS_OPEN_CHAT_NAME = """
+const title = document.querySelector('#main header span[title]');
+return title ? title.getAttribute('title') : null;
+"""
+
+# Types a message into the focused input as one edit; Enter stays a real keypress
+# so WhatsApp's submit handler fires. False when execCommand is refused
+_JS_INSERT_TEXT = """
+const box = arguments[0];
+box.focus();
+const lines = arguments[1].split('\\n');
+for (let i = 0; i < lines.length; i++) {
+    const ok = (i === 0 || document.execCommand('insertLineBreak')) &&
+        (!lines[i] || document.execCommand('insertText', false, lines[i]));
+    if (!ok) {
+        // Undo the partial insert so the fallback doesn't type it twice
+        document.execCommand('selectAll');
+        document.execCommand('delete');
+        return false;
+    }
+}
+return true;
+"""
+
+# First span whose title is exactly the argument, null if none
+_JS_SPAN_BY_TITLE = """
+for (const span of document.querySelectorAll('span[title]')) {
+    if (span.getAttribute('title') === arguments[0]) return span;
+}
+return null;
+"""
+
+# True once the newest outgoing bubble in the open chat contains the given text
+_JS_LAST_OUTGOING_HAS = """
+const out = document.querySelectorAll('#main div.message-out');
+return out.length > 0 && out[out.length - 1].innerText.includes(arguments[0]);
+"""
+
+# The chat element at an index, fetched only when it has to be clicked
+_JS_CHAT_AT = "return window.__wa_chatItems ? (window.__wa_chatItems()[arguments[0]] || null) : null"
+
 
 class WhatsAppService:
     """
@@ -51,8 +305,13 @@ class WhatsAppService:
         self.driver = None
         self.is_running = False
         self.is_connected = False
-        self.message_queue = Queue()
-        self.notification_callbacks: List[Callable] = []
+        # Bounded so an unpolled queue can't grow forever; oldest messages drop first
+        self.message_queue = deque(
+            maxlen=Config.get("whatsapp", "max_pending_messages", default=1000)
+        )
+        self._queue_lock = Lock()
+        # Rebuilt on register, so the monitor thread can iterate it without a lock
+        self.notification_callbacks: tuple = ()
         self.gui_window = None  # Reference to GUI window for debug logging
 
         # Database for chat history
@@ -66,13 +325,33 @@ class WhatsAppService:
         self.monitor_thread = None
         self.stop_event = Event()
 
+        # Open unread chats with the next-unread shortcut instead of clicking (opt-in)
+        self.keyboard_navigation = Config.get("whatsapp", "keyboard_navigation", default=False)
+
+        # Message IDs: per-session salt plus a counter, unique without a urandom call each
+        self._session_salt = uuid.uuid4().hex[:8]
+        self._message_counter = itertools.count()
+
         # Last seen message tracking
-        self.last_seen_messages: Dict[str, str] = {}
-        self.last_message_previews: Dict[str, str] = {}  # Track message previews in chat list
+        # Preview values are hash() fingerprints: only ever compared within this process
+        self.last_message_previews: Dict[str, int] = {}  # Track message previews in chat list
+
+        # Recently read messages by _seen_key, oldest first (bounded LRU)
+        self._seen: OrderedDict = OrderedDict()
         self.last_check_time = datetime.now()
 
+        # Set while the mutation observer can't be reinstalled; scans then
+        # fall back to one every OBSERVER_RETRY_INTERVAL seconds
+        self._observer_missing = False
+        self._next_fallback_scan = 0.0
+
         # Thread safety
-        self.driver_lock = Lock()
+        self.driver_lock = RLock()
+
+        # Sends in flight; the monitor waits on this between chats so a send
+        # never sits behind a whole scan
+        self._pending_sends = 0
+        self._send_cond = Condition()
 
         logger.info("WhatsApp service initialized")
 
@@ -85,7 +364,7 @@ class WhatsAppService:
         if self.gui_window:
             try:
                 self.gui_window.log_debug(message, level)
-            except:
+            except Exception:
                 pass  # Ignore if window is closed
 
     def start(self, headless: bool = False) -> bool:
@@ -146,6 +425,12 @@ class WhatsAppService:
             logger.info("Starting Chrome...")
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
 
+            # Reusable waits for the send and read paths (they only hold the driver,
+            # so a page refresh doesn't invalidate them)
+            self._wait3 = WebDriverWait(self.driver, 3)
+            self._wait5 = WebDriverWait(self.driver, 5)
+            self._wait10 = WebDriverWait(self.driver, 10)
+
             logger.info("Navigating to WhatsApp Web...")
             self.driver.get('https://web.whatsapp.com')
 
@@ -153,14 +438,7 @@ class WhatsAppService:
             try:
                 logger.info("Checking for existing session...")
                 # Try multiple selectors and increase timeout to 60 seconds
-                WebDriverWait(self.driver, 60).until(
-                    lambda driver: (
-                        driver.find_elements(By.CSS_SELECTOR, '[data-testid="chat-list"]') or
-                        driver.find_elements(By.CSS_SELECTOR, '[data-testid="conversation-panel-wrapper"]') or
-                        driver.find_elements(By.XPATH, '//div[@id="pane-side"]') or
-                        driver.find_elements(By.CSS_SELECTOR, 'div[data-testid="chat"]')
-                    )
-                )
+                WebDriverWait(self.driver, 60).until(_chat_list_loaded)
                 logger.info("✓ WhatsApp session restored successfully")
                 self.is_connected = True
 
@@ -170,14 +448,7 @@ class WhatsAppService:
 
                 # Wait up to 3 minutes for QR scan (increased from 2)
                 try:
-                    WebDriverWait(self.driver, 180).until(
-                        lambda driver: (
-                            driver.find_elements(By.CSS_SELECTOR, '[data-testid="chat-list"]') or
-                            driver.find_elements(By.CSS_SELECTOR, '[data-testid="conversation-panel-wrapper"]') or
-                            driver.find_elements(By.XPATH, '//div[@id="pane-side"]') or
-                            driver.find_elements(By.CSS_SELECTOR, 'div[data-testid="chat"]')
-                        )
-                    )
+                    WebDriverWait(self.driver, 180).until(_chat_list_loaded)
                     logger.info("✓ QR code scanned successfully!")
                     self.is_connected = True
 
@@ -193,6 +464,14 @@ class WhatsAppService:
             except Exception as e:
                 logger.warning(f"Could not minimize window: {e}")
 
+            # DEBUG: Dump the chat list once so selectors can be checked against the live DOM
+            if Config.get("whatsapp", "debug_dump_html", default=False):
+                self._dump_chat_list_html()
+
+            # Scan helpers live in the page; watch the chat list for changes
+            self._install_chat_helpers()
+            self._install_mutation_observer()
+
             # Start monitoring thread
             self.is_running = True
             self.stop_event.clear()
@@ -217,7 +496,12 @@ class WhatsAppService:
             try:
                 if not self.is_connected:
                     logger.debug("Not connected, waiting...")
-                    time.sleep(5)
+                    self.stop_event.wait(5)
+                    continue
+
+                # Block until the chat list changes (the first pass scans right
+                # away to record the current previews)
+                if check_count > 0 and not self._wait_for_mutations(MUTATION_WAIT_TIMEOUT):
                     continue
 
                 check_count += 1
@@ -231,25 +515,21 @@ class WhatsAppService:
                     logger.info(f"✓ Found {len(new_messages)} new message(s)")
                     self._log_debug(f"Found {len(new_messages)} new message(s)!", "SUCCESS")
 
+                    # Save the whole scan in one transaction and queue it under one lock
+                    self.db.save_messages(new_messages)
+                    with self._queue_lock:
+                        self.message_queue.extend(new_messages)
+
                     for message in new_messages:
                         logger.info(f"  - From: {message.sender_name}, Content: {message.content[:50]}...")
                         self._log_debug(f"📩 Message from {message.sender_name}: {message.content[:50]}...", "SUCCESS")
 
-                        # Save to database
-                        self.db.save_message(message)
-
-                        # Add to queue
-                        self.message_queue.put(message)
-
                         # Trigger notifications
                         self._trigger_notification(message)
                         self._log_debug(f"Notification triggered for {message.sender_name}", "SUCCESS")
                 else:
                     logger.debug(f"[Check #{check_count}] No new messages")
 
-                # Check every 3 seconds
-                time.sleep(3)
-
             except Exception as e:
                 logger.error(f"Error in message monitor: {e}", exc_info=True)
                 self._log_debug(f"Error in monitor: {str(e)}", "ERROR")
@@ -258,135 +538,174 @@ class WhatsAppService:
         logger.info("Message monitoring stopped")
         self._log_debug("Message monitoring stopped", "WARNING")
 
+    def _dump_chat_list_html(self):
+        """
+        Write the outer HTML of #pane-side to ~/whatsapp_page_dump.html
+
+        Pulled over CDP for that node only, rather than page_source, which
+        ships the whole document (inline SVGs and styles) over the wire.
+        """
+        try:
+            root = self.driver.execute_cdp_cmd("DOM.getDocument", {"depth": 0})["root"]["nodeId"]
+            node = self.driver.execute_cdp_cmd(
+                "DOM.querySelector", {"nodeId": root, "selector": "#pane-side"}
+            )["nodeId"]
+            if not node:
+                logger.warning("Could not dump HTML: #pane-side not found")
+                return
+
+            html = self.driver.execute_cdp_cmd("DOM.getOuterHTML", {"nodeId": node})["outerHTML"]
+            dump_file = Path.home() / "whatsapp_page_dump.html"
+            dump_file.write_text(html, encoding='utf-8')
+            logger.info(f"📄 Dumped chat list HTML to: {dump_file}")
+
+        except Exception as e:
+            logger.error(f"Could not dump HTML: {e}")
+
+    def _next_message_id(self) -> str:
+        """Local message ID, unique across sessions"""
+        return f"{self._session_salt}-{next(self._message_counter)}"
+
+    def _install_chat_helpers(self):
+        """
+        Define the chat scan helpers in this page and in every later page load
+
+        Called before the monitor starts or with driver_lock held.
+        """
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": _JS_CHAT_HELPERS}
+            )
+            self.driver.execute_cdp_cmd("Runtime.evaluate", {"expression": _JS_CHAT_HELPERS})
+
+        except WebDriverException as e:
+            logger.warning(f"Could not install chat scan helpers: {e}")
+
+    def _install_mutation_observer(self) -> bool:
+        """
+        Install the chat list MutationObserver in the current page
+
+        Returns:
+            True if the observer is in place
+        """
+        try:
+            with self.driver_lock:
+                result = self.driver.execute_cdp_cmd(
+                    "Runtime.evaluate",
+                    {"expression": _JS_INSTALL_OBSERVER, "returnByValue": True}
+                )
+            installed = bool(result.get("result", {}).get("value"))
+            if not installed:
+                logger.debug("Chat list not present yet, mutation observer not installed")
+            return installed
+
+        except WebDriverException as e:
+            logger.warning(f"Could not install mutation observer: {e}")
+            return False
+
+    def _wait_for_mutations(self, timeout: float) -> bool:
+        """
+        Block until the chat list has changed
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if a scan is due (mutations seen, or the observer was lost
+            and had to be reinstalled), False on timeout or stop
+        """
+        def mutated(driver):
+            if self.stop_event.is_set():
+                return True
+            with self.driver_lock:
+                pending = driver.execute_script(_JS_PENDING_MUTATIONS)
+            if pending == -2:
+                # Tab is mid-load; a scan now would only see a half-built chat list
+                return False
+            if pending == -1:
+                # Page was reloaded; reinstall and rescan since changes may have been missed
+                if self._install_mutation_observer():
+                    self._observer_missing = False
+                    return True
+                return self._fallback_scan_due()
+            return pending > 0
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=1.0).until(mutated)
+        except TimeoutException:
+            return False
+
+        if self.stop_event.is_set():
+            return False
+
+        # Consume the signal; the scan below picks up whatever changed
+        with self.driver_lock:
+            self.driver.execute_script(_JS_DRAIN_MUTATIONS)
+        return True
+
+    def _fallback_scan_due(self) -> bool:
+        """
+        Rate-limit rescans while the mutation observer is missing
+
+        Returns:
+            True right after the observer is lost, then once every
+            OBSERVER_RETRY_INTERVAL seconds until it is back
+        """
+        now = time.monotonic()
+        if not self._observer_missing:
+            logger.warning(f"Mutation observer missing, rescanning every {OBSERVER_RETRY_INTERVAL}s until it is back")
+            self._observer_missing = True
+        elif now < self._next_fallback_scan:
+            return False
+
+        self._next_fallback_scan = now + OBSERVER_RETRY_INTERVAL
+        return True
+
     def _check_for_new_messages(self) -> List[WhatsAppMessage]:
         """Check for new messages by monitoring chat list for changes"""
         new_messages = []
 
+        # Chats whose preview changed, opened after the scan
+        changed = []
+
         try:
             with self.driver_lock:
                 self._log_debug("Checking all visible chats for new messages...", "DEBUG")
 
-                # DEBUG: Dump page source on first check to see what's actually there
-                if not hasattr(self, '_dumped_html'):
-                    try:
-                        page_html = self.driver.page_source
-                        dump_file = Path.home() / "whatsapp_page_dump.html"
-                        dump_file.write_text(page_html, encoding='utf-8')
-                        logger.info(f"📄 Dumped page HTML to: {dump_file}")
-                        self._log_debug(f"Page HTML dumped to: {dump_file}", "DEBUG")
-                        self._dumped_html = True
-                    except Exception as e:
-                        logger.error(f"Could not dump HTML: {e}")
-
-                # Try multiple selectors for chat list
-                all_chats = []
-
-                # Method 1: role="listitem"
-                all_chats = self.driver.find_elements(By.CSS_SELECTOR, 'div[role="listitem"]')
-                logger.debug(f"Method 1 (role=listitem): Found {len(all_chats)} chats")
-
-                # Method 2: If method 1 fails, try data-testid
-                if len(all_chats) == 0:
-                    all_chats = self.driver.find_elements(By.CSS_SELECTOR, '[data-testid="chat"]')
-                    logger.debug(f"Method 2 (data-testid=chat): Found {len(all_chats)} chats")
-
-                # Method 3: Try class-based selector
-                if len(all_chats) == 0:
-                    all_chats = self.driver.find_elements(By.CSS_SELECTOR, '._3m_Xw')
-                    logger.debug(f"Method 3 (class _3m_Xw): Found {len(all_chats)} chats")
-
-                # Method 4: Try finding the sidebar and getting all divs with specific structure
-                if len(all_chats) == 0:
-                    try:
-                        sidebar = self.driver.find_element(By.CSS_SELECTOR, '#pane-side')
-                        all_chats = sidebar.find_elements(By.XPATH, './/div[contains(@class, "chat")]')
-                        logger.debug(f"Method 4 (sidebar divs): Found {len(all_chats)} chats")
-                    except:
-                        pass
+                # Harvest name/preview/unread for every chat in one round trip
+                chats = self.driver.execute_script(_JS_SCAN_CHATS, 20)
+                if chats is None:
+                    # Helpers missing from this document; define them and retry once
+                    self.driver.execute_script(_JS_CHAT_HELPERS)
+                    chats = self.driver.execute_script(_JS_SCAN_CHATS, 20) or []
 
-                logger.debug(f"Found {len(all_chats)} total chat(s) in list")
-                self._log_debug(f"Scanning {len(all_chats)} chat(s) for changes...", "DEBUG")
+                logger.debug(f"Found {len(chats)} total chat(s) in list")
+                self._log_debug(f"Scanning {len(chats)} chat(s) for changes...", "DEBUG")
 
-                # If we found chats, check each one
-                if len(all_chats) > 0:
-                    # Check first 20 chats for new messages (should cover recent conversations)
-                    for idx, chat in enumerate(all_chats[:20], 1):
+                # If we found chats, check each one (first 20 cover recent conversations)
+                if len(chats) > 0:
+                    for chat in chats:
+                        idx = chat['index'] + 1
                         try:
-                            # NEW APPROACH: Look for unread indicator badges/spans
-                            has_unread = False
-
-                            # Check for unread badge (green circle with number)
-                            try:
-                                unread_badge = chat.find_element(By.CSS_SELECTOR, 'span[data-testid="icon-unread"], span[aria-label*="unread"]')
-                                has_unread = True
-                                logger.debug(f"Chat #{idx} has unread badge")
-                            except:
-                                pass
-
-                            # Check for bold text (indicates unread)
-                            try:
-                                bold_elem = chat.find_element(By.CSS_SELECTOR, 'span[title][dir="auto"]')
-                                font_weight = bold_elem.value_of_css_property('font-weight')
-                                if font_weight and int(font_weight) >= 600:
-                                    has_unread = True
-                                    logger.debug(f"Chat #{idx} has bold text (unread)")
-                            except:
-                                pass
-
-                            if not has_unread:
+                            if not chat['hasUnread']:
                                 continue  # Skip read messages
 
                             logger.debug(f"Chat #{idx} appears to have unread messages!")
 
-                            # Get chat name
-                            chat_name = None
-                            try:
-                                chat_name_elem = chat.find_element(
-                                    By.CSS_SELECTOR,
-                                    'span[dir="auto"][title]'
-                                )
-                                chat_name = chat_name_elem.get_attribute('title')
-                            except:
-                                try:
-                                    chat_name_elem = chat.find_element(
-                                        By.CSS_SELECTOR,
-                                        'span[title]'
-                                    )
-                                    chat_name = chat_name_elem.get_attribute('title')
-                                except:
-                                    continue
-
+                            chat_name = chat['name']
                             if not chat_name or len(chat_name.strip()) == 0:
                                 continue
 
-                            # Get message preview (last message text shown in chat list)
-                            try:
-                                # Try to find the message preview span
-                                preview_elem = chat.find_element(
-                                    By.CSS_SELECTOR,
-                                    'span[dir="ltr"]'
-                                )
-                                message_preview = preview_elem.text.strip()
-                            except:
-                                try:
-                                    # Alternative: look for any span with message text
-                                    preview_spans = chat.find_elements(By.CSS_SELECTOR, 'span')
-                                    message_preview = ""
-                                    for span in preview_spans:
-                                        text = span.text.strip()
-                                        if len(text) > 5:  # Meaningful text
-                                            message_preview = text
-                                            break
-                                except:
-                                    message_preview = ""
-
+                            # Last message text shown in chat list
+                            message_preview = chat['preview']
                             if not message_preview:
                                 continue
 
                             # Check if this is a new/changed message preview
+                            preview_hash = hash(message_preview)
                             if chat_name in self.last_message_previews:
                                 last_preview = self.last_message_previews[chat_name]
-                                if last_preview == message_preview:
+                                if last_preview == preview_hash:
                                     # No change in this chat
                                     continue
                                 else:
@@ -394,121 +713,205 @@ class WhatsAppService:
                                     logger.info(f"✓ Detected new message in chat: {chat_name}")
                                     self._log_debug(f"NEW: Message preview changed for {chat_name}", "SUCCESS")
 
-                                    # Update preview
-                                    self.last_message_previews[chat_name] = message_preview
-
-                                    # Click to open chat and read the new message
-                                    logger.debug(f"  Opening chat to read new message...")
-                                    chat.click()
-                                    time.sleep(1.5)
-
-                                    # Read messages from this chat
-                                    chat_messages = self._read_current_chat_messages(chat_name)
-                                    logger.info(f"  Read {len(chat_messages)} new message(s) from {chat_name}")
-                                    if chat_messages:
-                                        self._log_debug(f"Read {len(chat_messages)} new message(s) from {chat_name}", "SUCCESS")
-                                    new_messages.extend(chat_messages)
+                                    # Update preview; the chat is opened once the scan is done
+                                    self.last_message_previews[chat_name] = preview_hash
+                                    changed.append(chat)
                             else:
                                 # First time seeing this chat - store preview but don't trigger notification
                                 logger.debug(f"First time seeing chat: {chat_name}, storing preview")
-                                self.last_message_previews[chat_name] = message_preview
+                                self.last_message_previews[chat_name] = preview_hash
 
-                        except (StaleElementReferenceException, NoSuchElementException) as e:
-                            logger.debug(f"  Error processing chat #{idx}: {e}")
-                            continue
                         except Exception as e:
                             logger.debug(f"  Unexpected error processing chat #{idx}: {e}")
                             continue
 
-                    if not new_messages:
-                        logger.debug("No new messages detected")
                 else:
                     # No chats found at all - might be page loading issue
                     self._log_debug("WARNING: Could not find any chats! Check if page loaded correctly.", "WARNING")
                     logger.warning("Could not find any chat elements on page")
 
+            # Open changed chats in their own critical sections so a send can get in between
+            if changed:
+                if self.keyboard_navigation:
+                    self._yield_to_senders()
+                    with self.driver_lock:
+                        new_messages.extend(self._read_unread_by_keyboard(changed))
+                else:
+                    for chat in changed:
+                        if self.stop_event.is_set():
+                            break
+                        self._yield_to_senders()
+                        with self.driver_lock:
+                            new_messages.extend(self._read_chat_at(chat))
+
+            if not new_messages:
+                logger.debug("No new messages detected")
+
         except Exception as e:
             logger.error(f"Error checking for new messages: {e}", exc_info=True)
             self._log_debug(f"Error checking messages: {str(e)}", "ERROR")
 
         return new_messages
 
+    def _is_seen(self, key: tuple) -> bool:
+        """Check the dedup set, refreshing the entry's recency on a hit"""
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return True
+        return False
+
+    def _mark_seen(self, key: tuple):
+        """Add a message to the dedup set, forgetting the oldest past _SEEN_MAX"""
+        self._seen[key] = None
+        if len(self._seen) > _SEEN_MAX:
+            self._seen.popitem(last=False)
+
+    def _yield_to_senders(self, timeout: float = 30):
+        """
+        Block while send_message calls are waiting for the driver
+
+        Args:
+            timeout: Longest to defer before carrying on regardless
+        """
+        with self._send_cond:
+            self._send_cond.wait_for(lambda: self._pending_sends == 0, timeout=timeout)
+
+    def _read_chat_at(self, chat: dict) -> List[WhatsAppMessage]:
+        """
+        Click a chat from the last scan open and read its new messages
+
+        Args:
+            chat: Chat record from the chat list scan
+
+        Returns:
+            New incoming messages in the chat
+        """
+        chat_name = chat['name']
+
+        # Only now fetch the element, to click it open
+        logger.debug(f"  Opening chat to read new message...")
+        try:
+            chat_elem = self.driver.execute_script(_JS_CHAT_AT, chat['index'])
+            if chat_elem is None:
+                return []
+            chat_elem.click()
+        except WebDriverException as e:
+            logger.debug(f"  Could not open chat {chat_name}: {e}")
+            return []
+
+        # Read messages from this chat
+        chat_messages = self._read_current_chat_messages(chat_name)
+        logger.info(f"  Read {len(chat_messages)} new message(s) from {chat_name}")
+        if chat_messages:
+            self._log_debug(f"Read {len(chat_messages)} new message(s) from {chat_name}", "SUCCESS")
+        return chat_messages
+
+    def _read_unread_by_keyboard(self, changed: List[dict]) -> List[WhatsAppMessage]:
+        """
+        Walk the unread chats with WhatsApp's next-unread shortcut instead of clicking each
+
+        Args:
+            changed: Chat records whose preview changed in the last scan
+
+        Returns:
+            New incoming messages across those chats
+        """
+        pending = {chat['name'] for chat in changed}
+        visited = set()
+        messages = []
+
+        try:
+            # Escape drops focus from the search box so the shortcut reaches the app
+            self.driver.switch_to.active_element.send_keys(Keys.ESCAPE)
+
+            while pending:
+                previous = self.driver.execute_script(_JS_OPEN_CHAT_NAME)
+                self.driver.switch_to.active_element.send_keys(Keys.CONTROL, Keys.SHIFT, ']')
+
+                try:
+                    self._wait3.until(
+                        lambda driver: driver.execute_script(_JS_OPEN_CHAT_NAME) not in (None, previous)
+                    )
+                except TimeoutException:
+                    break  # Header stopped changing: no more unread chats
+
+                chat_name = self.driver.execute_script(_JS_OPEN_CHAT_NAME)
+                if chat_name in visited:
+                    break  # Wrapped around
+                visited.add(chat_name)
+
+                if chat_name in pending:
+                    pending.discard(chat_name)
+                    chat_messages = self._read_current_chat_messages(chat_name)
+                    logger.info(f"  Read {len(chat_messages)} new message(s) from {chat_name}")
+                    messages.extend(chat_messages)
+
+        except WebDriverException as e:
+            logger.debug(f"  Keyboard navigation failed: {e}")
+
+        # Anything the shortcut didn't reach is clicked open as usual
+        for chat in changed:
+            if chat['name'] in pending:
+                messages.extend(self._read_chat_at(chat))
+
+        return messages
+
     def _read_current_chat_messages(self, chat_name: str, limit: int = 10) -> List[WhatsAppMessage]:
         """Read messages from the currently open chat"""
         messages = []
 
         try:
-            # Wait for messages to load
-            time.sleep(1)
+            # Wait for the message panel to render instead of a fixed sleep
+            self._wait3.until(_EC_MSG_CONTAINER)
 
             logger.debug(f"    Reading messages from {chat_name}...")
 
-            # Find message container
-            message_container = self.driver.find_element(
-                By.CSS_SELECTOR,
-                '[data-testid="conversation-panel-messages"]'
-            )
-            logger.debug(f"    Found message container")
+            # Every field of the last N messages in one round trip
+            records = self.driver.execute_script(_JS_READ_MESSAGES, limit)
+            now = datetime.now()
+            if records is None:
+                raise NoSuchElementException("Message container not found")
 
-            # Find all message elements (recent ones)
-            message_elements = message_container.find_elements(
-                By.CSS_SELECTOR,
-                'div[data-testid="msg-container"]'
-            )
-            logger.debug(f"    Found {len(message_elements)} total message elements")
+            # Preview changed but the tail didn't (edit, reaction, own message): nothing to read
+            last_key = _seen_key(chat_name, records[-1], now) if records else None
+            if last_key is not None and self._is_seen(last_key):
+                logger.debug(f"    Last message already seen, skipping {chat_name}")
+                return messages
 
-            # Get last N messages
-            recent_messages = message_elements[-limit:]
-            logger.debug(f"    Processing last {len(recent_messages)} messages")
+            logger.debug(f"    Processing last {len(records)} messages")
 
-            for idx, msg_elem in enumerate(recent_messages, 1):
+            for idx, record in enumerate(records, 1):
                 try:
                     # Check if message is incoming or outgoing
-                    is_from_me = 'message-out' in msg_elem.get_attribute('class')
+                    is_from_me = record['fromMe']
 
                     # Get message text
-                    try:
-                        text_elem = msg_elem.find_element(By.CSS_SELECTOR, 'span.selectable-text')
-                        message_text = text_elem.text
-                    except:
-                        message_text = "[Media or unsupported message]"
+                    message_text = record['text']
+                    if message_text is None:
+                        message_text = _MEDIA_PLACEHOLDER
 
                     logger.debug(f"      Msg #{idx}: from_me={is_from_me}, text='{message_text[:30]}...'")
 
-                    # Get timestamp
-                    try:
-                        time_elem = msg_elem.find_element(By.CSS_SELECTOR, 'span[data-testid="msg-time"]')
-                        time_text = time_elem.text
-                        # For now, use current time (parsing WhatsApp time is complex)
-                        timestamp = datetime.now()
-                    except:
-                        timestamp = datetime.now()
-
-                    # Get sender name (for groups)
-                    sender_name = chat_name
-                    if not is_from_me:
-                        try:
-                            sender_elem = msg_elem.find_element(By.CSS_SELECTOR, 'span[dir="auto"][role="button"]')
-                            sender_name = sender_elem.text
-                        except:
-                            pass
-                    else:
-                        sender_name = "Me"
-
-                    # Create message ID
-                    message_id = str(uuid.uuid4())
-
-                    # Check if we've seen this message before
-                    if chat_name in self.last_seen_messages:
-                        if message_text == self.last_seen_messages[chat_name]:
+                    # Check if we've seen this message before (same text sent twice still counts)
+                    key = _seen_key(chat_name, record, now)
+                    if key is not None:
+                        if self._is_seen(key):
                             logger.debug(f"      Msg #{idx}: Already seen, skipping")
                             continue  # Already processed
+                        self._mark_seen(key)
 
                     # Only process incoming messages
                     if not is_from_me:
+                        # Get timestamp from the bubble; scan time only if it has none
+                        timestamp = _parse_pre_plain_text(record['pre'], now) or now
+
+                        # Get sender name (for groups)
+                        sender_name = record['sender'] or chat_name
+
                         # Create WhatsAppMessage object
+                        # ID is drawn only for messages we keep
                         wa_message = WhatsAppMessage(
-                            id=message_id,
+                            id=self._next_message_id(),
                             chat_name=chat_name,
                             sender_name=sender_name,
                             content=message_text,
@@ -522,9 +925,6 @@ class WhatsAppService:
                         messages.append(wa_message)
                         logger.info(f"      ✓ New message from {sender_name}: {message_text[:50]}...")
 
-                    # Update last seen
-                    self.last_seen_messages[chat_name] = message_text
-
                 except Exception as e:
                     logger.debug(f"      Error parsing message #{idx}: {e}")
                     continue
@@ -548,59 +948,76 @@ class WhatsAppService:
         Returns:
             True if successful, False otherwise
         """
+        # Announce the send so the monitor hands over the driver between chats
+        with self._send_cond:
+            self._pending_sends += 1
+        try:
+            return self._send_message(contact_name, message, retries)
+        finally:
+            with self._send_cond:
+                self._pending_sends -= 1
+                self._send_cond.notify_all()
+
+    def _send_message(self, contact_name: str, message: str, retries: int) -> bool:
+        """Search for the contact and send, retrying with a page refresh on failure"""
         for attempt in range(retries):
             try:
                 logger.info(f"Sending message to '{contact_name}' (attempt {attempt + 1}/{retries})")
 
                 with self.driver_lock:
                     # Find and click search box
-                    search_box = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div[contenteditable="true"][data-tab="3"]'))
-                    )
+                    search_box = self._wait10.until(_EC_SEARCH_BOX)
                     search_box.click()
-                    time.sleep(0.5)
 
                     # Clear and search for contact
                     search_box.clear()
                     search_box.send_keys(contact_name)
-                    time.sleep(2)
 
-                    # Click on contact from search results
+                    # Click on contact as soon as it shows in the search results
                     try:
-                        contact_elem = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_element_located((By.XPATH, f'//span[@title="{contact_name}"]'))
+                        # Exact title match in JS: no XPath to build, and quotes in names are safe
+                        contact_elem = self._wait5.until(
+                            lambda driver: driver.execute_script(_JS_SPAN_BY_TITLE, contact_name)
                         )
                         contact_elem.click()
-                        time.sleep(1)
+
+                        # Wait for the conversation header to switch to this contact
+                        self._wait5.until(EC.text_to_be_present_in_element(_SEL_CHAT_HEADER, contact_name))
                     except TimeoutException:
                         logger.warning(f"Contact '{contact_name}' not found")
                         return False
 
                     # Find message input box
-                    message_box = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div[contenteditable="true"][data-tab="10"]'))
-                    )
+                    message_box = self._wait10.until(_EC_MESSAGE_BOX)
                     message_box.click()
-                    time.sleep(0.3)
-
-                    # Type message (handle multi-line)
-                    lines = message.split('\n')
-                    for i, line in enumerate(lines):
-                        message_box.send_keys(line)
-                        if i < len(lines) - 1:
-                            message_box.send_keys(Keys.SHIFT, Keys.ENTER)
 
-                    time.sleep(0.3)
+                    # Insert the whole body in one call (line breaks included)
+                    inserted = self.driver.execute_script(_JS_INSERT_TEXT, message_box, message)
+                    if not inserted:
+                        # execCommand refused; type it line by line instead
+                        lines = message.split('\n')
+                        for i, line in enumerate(lines):
+                            message_box.send_keys(line)
+                            if i < len(lines) - 1:
+                                message_box.send_keys(Keys.SHIFT, Keys.ENTER)
 
                     # Send message
                     message_box.send_keys(Keys.ENTER)
-                    time.sleep(0.5)
+
+                    # Wait for the bubble to appear; Enter was pressed either way, so a
+                    # timeout must not trigger a retry (that would send twice)
+                    try:
+                        self._wait5.until(
+                            lambda driver: driver.execute_script(_JS_LAST_OUTGOING_HAS, message[:20])
+                        )
+                    except TimeoutException:
+                        logger.warning(f"Sent message to '{contact_name}' not visible yet")
 
                     logger.info(f"✓ Message sent to '{contact_name}'")
 
                     # Save to database
                     sent_message = WhatsAppMessage(
-                        id=str(uuid.uuid4()),
+                        id=self._next_message_id(),
                         chat_name=contact_name,
                         sender_name="Me",
                         content=message,
@@ -622,7 +1039,7 @@ class WhatsAppService:
                     try:
                         self.driver.refresh()
                         time.sleep(3)
-                    except:
+                    except WebDriverException:
                         pass
 
         logger.error(f"Failed to send message after {retries} attempts")
@@ -651,14 +1068,14 @@ class WhatsAppService:
 
     def get_unread_messages(self) -> List[WhatsAppMessage]:
         """Get unread messages from queue"""
-        messages = []
-        while not self.message_queue.empty():
-            messages.append(self.message_queue.get())
+        with self._queue_lock:
+            messages = list(self.message_queue)
+            self.message_queue.clear()
         return messages
 
     def register_notification_callback(self, callback: Callable[[WhatsAppNotification], None]):
         """Register a callback function for new message notifications"""
-        self.notification_callbacks.append(callback)
+        self.notification_callbacks = self.notification_callbacks + (callback,)
         logger.info(f"Registered notification callback: {callback.__name__}")
 
     def _trigger_notification(self, message: WhatsAppMessage):
@@ -670,7 +1087,8 @@ class WhatsAppService:
             timestamp=message.timestamp
         )
 
-        for callback in self.notification_callbacks:
+        callbacks = self.notification_callbacks
+        for callback in callbacks:
             try:
                 callback(notification)
             except Exception as e:
@@ -690,19 +1108,11 @@ class WhatsAppService:
                 self.driver.current_url
                 health['browser_running'] = True
 
-                # Check login
-                try:
-                    self.driver.find_element(By.CSS_SELECTOR, '[data-testid="chat-list"]')
-                    health['logged_in'] = True
-                except:
-                    health['logged_in'] = False
+                # Check login (find_elements returns [] instead of raising on a miss)
+                health['logged_in'] = bool(self.driver.find_elements(*_SEL_CHAT_LIST))
 
                 # Check phone connection
-                try:
-                    self.driver.find_element(By.XPATH, '//*[contains(text(), "Phone not connected")]')
-                    health['phone_connected'] = False
-                except:
-                    health['phone_connected'] = True
+                health['phone_connected'] = not self.driver.find_elements(*_SEL_PHONE_DISCONNECTED)
 
         except Exception as e:
             logger.error(f"Health check error: {e}")
@@ -724,7 +1134,7 @@ class WhatsAppService:
         if self.driver:
             try:
                 self.driver.quit()
-            except:
+            except WebDriverException:
                 pass
 
         # Close database
@@ -4,18 +4,63 @@ Communicates with Node.js bridge via HTTP
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
 import subprocess
 import time
 import logging
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Dict
 from threading import Thread, Event
 from dataclasses import dataclass
 
 from .whatsapp_models import WhatsAppMessage, WhatsAppNotification, MessageDirection, MessageType
 
+try:
+    from orjson import loads as _loads, dumps as _dumps
+except ImportError:
+    import json
+    from json import loads as _loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Bound once for the per-message path
+_INCOMING = MessageDirection.INCOMING
+_TEXT = MessageType.TEXT
+
+# Seconds of silence on the message stream before reconnecting (bridge heartbeat is 15s)
+STREAM_READ_TIMEOUT = 30
+
+# Adaptive polling: start fast, back off x1.5 while nothing happens
+POLL_MIN_INTERVAL = 0.5
+POLL_MAX_INTERVAL = 30.0
+READY_MAX_INTERVAL = 5.0  # Readiness waits have their own deadline, so cap lower
+
+# Seconds a resolved contact (or a "not found") is reused before searching again
+CONTACT_TTL = 300
+NEGATIVE_CONTACT_TTL = 30
+
+
+def _is_read_timeout(error: Exception) -> bool:
+    """
+    Check whether an error is a read timeout on an open response
+
+    Mid-body (iter_lines) requests reports these as ConnectionError wrapping
+    urllib3's ReadTimeoutError rather than as ReadTimeout.
+    """
+    if isinstance(error, requests.exceptions.ReadTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        inner = error.args[0] if error.args else None
+        return isinstance(inner, ReadTimeoutError) or isinstance(error.__context__, ReadTimeoutError)
+    return False
+
 
 class WhatsAppWebJSService:
     """WhatsApp service using whatsapp-web.js via Node.js bridge"""
@@ -27,10 +72,19 @@ class WhatsAppWebJSService:
         self.is_connected = False
         self.stop_event = Event()
         self.monitor_thread = None
+        self._stream_response = None
         self.notification_callbacks = []
         self.gui_window = None
         self.last_whatsapp_contact = None
 
+        # Normalized contact name -> (chat_id, chat_name, expires_at); chat_id None caches a miss
+        self._contact_cache: Dict[str, tuple] = {}
+
+        # One keep-alive pool for every bridge call (the stream holds one connection)
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+        self._http.headers.update({"Connection": "keep-alive"})
+
     def set_gui_window(self, window):
         """Set reference to GUI window for debug logging"""
         self.gui_window = window
@@ -45,6 +99,9 @@ class WhatsAppWebJSService:
 
     def start(self) -> bool:
         """Start WhatsApp Web.js bridge"""
+        # Cleared up front so the readiness waits below can be cut short by stop()
+        self.stop_event.clear()
+
         try:
             logger.info("Starting WhatsApp Web.js bridge...")
             self._log_debug("Starting WhatsApp Web.js bridge...", "INFO")
@@ -143,23 +200,28 @@ class WhatsAppWebJSService:
 
             # Wait for bridge to be ready
             logger.info("Waiting for bridge to start...")
-            max_wait = 30  # 30 seconds
-            for i in range(max_wait):
+            deadline = time.monotonic() + 30  # 30 seconds
+            interval = POLL_MIN_INTERVAL
+            while True:
                 try:
-                    response = requests.get(f"{self.bridge_url}/health", timeout=1)
+                    response = self._http.get(f"{self.bridge_url}/health", timeout=1)
                     if response.status_code == 200:
                         logger.info("✓ Bridge is running")
                         self._log_debug("Bridge is running", "SUCCESS")
                         break
                 except requests.exceptions.RequestException:
-                    time.sleep(1)
+                    pass
 
-                if i == max_wait - 1:
+                if time.monotonic() >= deadline:
                     logger.error("Bridge failed to start within timeout")
                     self._log_debug("Bridge failed to start", "ERROR")
                     self.stop()
                     return False
 
+                if self.stop_event.wait(interval):
+                    return False
+                interval = min(interval * 1.5, READY_MAX_INTERVAL)
+
             # Check WhatsApp client status
             logger.info("Checking WhatsApp client status...")
             status = self._get_status()
@@ -170,20 +232,23 @@ class WhatsAppWebJSService:
 
             # Start monitoring thread
             self.is_running = True
-            self.stop_event.clear()
             self.monitor_thread = Thread(target=self._monitor_messages, daemon=True)
             self.monitor_thread.start()
 
             # Wait for client to be ready
             logger.info("Waiting for WhatsApp client to be ready...")
-            for i in range(120):  # 2 minutes
+            deadline = time.monotonic() + 120  # 2 minutes
+            interval = POLL_MIN_INTERVAL
+            while time.monotonic() < deadline:
                 status = self._get_status()
                 if status and status.get('ready'):
                     self.is_connected = True
                     logger.info("✓ WhatsApp client is ready!")
                     self._log_debug("WhatsApp client ready!", "SUCCESS")
                     return True
-                time.sleep(1)
+                if self.stop_event.wait(interval):
+                    return False
+                interval = min(interval * 1.5, READY_MAX_INTERVAL)
 
             logger.warning("WhatsApp client not ready yet, but continuing...")
             return True
@@ -202,6 +267,14 @@ class WhatsAppWebJSService:
         self.is_connected = False
         self.stop_event.set()
 
+        # Closing the stream unblocks the monitor thread's socket read
+        stream = self._stream_response
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5)
 
@@ -212,78 +285,139 @@ class WhatsAppWebJSService:
             except:
                 self.bridge_process.kill()
 
+        self._http.close()
+
         logger.info("WhatsApp Web.js service stopped")
 
     def _get_status(self) -> Optional[dict]:
         """Get bridge status"""
         try:
-            response = requests.get(f"{self.bridge_url}/status", timeout=2)
+            response = self._http.get(f"{self.bridge_url}/status", timeout=2)
             if response.status_code == 200:
-                return response.json()
+                return _loads(response.content)
         except:
             pass
         return None
 
     def _monitor_messages(self):
-        """Background thread to poll for new messages"""
+        """Background thread that follows the bridge's message stream"""
         logger.info("Message monitoring started")
         self._log_debug("Message monitoring started", "SUCCESS")
 
+        backoff = 1
+        legacy_bridge = False
+
         while self.is_running and not self.stop_event.is_set():
             try:
-                # Poll for new messages
-                response = requests.get(f"{self.bridge_url}/messages/new", timeout=2)
+                # Blocks on the socket until the bridge pushes a message; the
+                # bridge sends a heartbeat every 15s, well inside the read timeout
+                with self._http.get(
+                    f"{self.bridge_url}/messages/stream",
+                    stream=True,
+                    timeout=(5, STREAM_READ_TIMEOUT)
+                ) as response:
+                    self._stream_response = response
+                    if response.status_code == 404:
+                        legacy_bridge = True
+                        break
+                    response.raise_for_status()
+                    backoff = 1
 
-                if response.status_code == 200:
-                    data = response.json()
-                    messages = data.get('messages', [])
-
-                    if messages:
-                        logger.info(f"✓ Received {len(messages)} new message(s)")
-                        self._log_debug(f"Received {len(messages)} new message(s)", "SUCCESS")
-
-                        for msg_data in messages:
-                            # Convert to WhatsAppMessage
-                            from datetime import datetime
-
-                            # Convert Unix timestamp to datetime
-                            try:
-                                timestamp = datetime.fromtimestamp(msg_data['timestamp'])
-                            except:
-                                timestamp = datetime.now()
-
-                            message = WhatsAppMessage(
-                                id=msg_data['id'],
-                                chat_name=msg_data['chatName'],
-                                sender_name=msg_data['senderName'],
-                                content=msg_data['body'],
-                                timestamp=timestamp,
-                                direction=MessageDirection.INCOMING,  # Fixed: use INCOMING not RECEIVED
-                                message_type=MessageType.TEXT,
-                                is_from_me=msg_data['isFromMe'],
-                                is_read=True
-                            )
-
-                            # Store the 'from' field for direct replies
-                            message.from_id = msg_data['from']
-
-                            logger.info(f"  📩 From {message.sender_name}: {message.content[:50]}...")
-                            self._log_debug(f"📩 {message.sender_name}: {message.content[:50]}...", "SUCCESS")
-
-                            # Trigger notification
-                            self._trigger_notification(message)
-
-                # Check every 2 seconds (faster polling)
-                time.sleep(2)
+                    # Raw bytes: the JSON parser takes them directly, no decode pass
+                    for line in response.iter_lines():
+                        if self.stop_event.is_set():
+                            break
+                        if not line or not line.startswith(b'data:'):
+                            continue  # Heartbeat comment or event separator
+
+                        msg_data = _loads(line[5:])
+                        logger.info("✓ Received 1 new message")
+                        self._handle_message(msg_data)
 
             except Exception as e:
+                if self.stop_event.is_set():
+                    break
+                if _is_read_timeout(e):
+                    # Stream went quiet past the heartbeat; reconnect straight away
+                    logger.debug("Message stream timed out, reconnecting")
+                    continue
                 logger.error(f"Error in message monitor: {e}")
                 self._log_debug(f"Monitor error: {e}", "ERROR")
-                time.sleep(5)
+                self.stop_event.wait(backoff)
+                backoff = min(backoff * 2, 30)
+
+            finally:
+                self._stream_response = None
+
+        if legacy_bridge:
+            logger.warning("Bridge has no /messages/stream, falling back to polling")
+            self._poll_messages()
 
         logger.info("Message monitoring stopped")
         self._log_debug("Message monitoring stopped", "WARNING")
 
+    def _poll_messages(self):
+        """Poll /messages/new for bridges without the stream, backing off while idle"""
+        interval = POLL_MIN_INTERVAL
+
+        while self.is_running and not self.stop_event.is_set():
+            try:
+                response = self._http.get(f"{self.bridge_url}/messages/new", timeout=2)
+
+                messages = []
+                if response.status_code == 200:
+                    messages = _loads(response.content).get('messages', [])
+
+                if messages:
+                    logger.info(f"✓ Received {len(messages)} new message(s)")
+                    self._log_debug(f"Received {len(messages)} new message(s)", "SUCCESS")
+                    for msg_data in messages:
+                        self._handle_message(msg_data)
+                    interval = POLL_MIN_INTERVAL
+                else:
+                    interval = min(interval * 1.5, POLL_MAX_INTERVAL)
+
+            except Exception as e:
+                logger.error(f"Error polling messages: {e}")
+                self._log_debug(f"Monitor error: {e}", "ERROR")
+                interval = min(interval * 1.5, POLL_MAX_INTERVAL)
+
+            self.stop_event.wait(interval)
+
+    def _handle_message(self, msg_data: dict):
+        """
+        Convert a bridge message to a WhatsAppMessage and notify
+
+        Args:
+            msg_data: Message object as sent by the bridge
+        """
+        # Convert Unix timestamp to datetime
+        try:
+            timestamp = datetime.fromtimestamp(msg_data['timestamp'])
+        except (KeyError, TypeError, ValueError, OSError, OverflowError):
+            timestamp = datetime.now()
+
+        message = WhatsAppMessage(
+            id=msg_data['id'],
+            chat_name=msg_data['chatName'],
+            sender_name=msg_data['senderName'],
+            content=msg_data['body'],
+            timestamp=timestamp,
+            direction=_INCOMING,  # Fixed: use INCOMING not RECEIVED
+            message_type=_TEXT,
+            is_from_me=msg_data['isFromMe'],
+            is_read=True
+        )
+
+        # Store the 'from' field for direct replies
+        message.from_id = msg_data['from']
+
+        logger.info(f"  📩 From {message.sender_name}: {message.content[:50]}...")
+        self._log_debug(f"📩 {message.sender_name}: {message.content[:50]}...", "SUCCESS")
+
+        # Trigger notification
+        self._trigger_notification(message)
+
     def _trigger_notification(self, message: WhatsAppMessage):
         """Trigger notification callbacks"""
         notification = WhatsAppNotification(
@@ -296,6 +430,10 @@ class WhatsAppWebJSService:
 
         # Store the chat ID for direct replies (avoid search)
         self._last_chat_from = message.from_id if hasattr(message, 'from_id') else None
+        if self._last_chat_from:
+            # Quick replies address the chat by name; resolve it without a search.
+            # (In groups the sender is a member, not this chat, so only the chat name is cached)
+            self._cache_contact(message.chat_name, self._last_chat_from, message.chat_name, CONTACT_TTL)
 
         for callback in self.notification_callbacks:
             try:
@@ -309,41 +447,82 @@ class WhatsAppWebJSService:
         self.notification_callbacks.append(callback)
         logger.info(f"Registered notification callback: {callback.__name__}")
 
-    def send_message(self, contact_name: str, message: str) -> bool:
-        """Send a message to a contact"""
-        try:
-            # First, search for the contact
-            search_response = requests.post(
-                f"{self.bridge_url}/contacts/search",
-                json={"query": contact_name},
-                timeout=5
-            )
+    def _cache_contact(self, name: str, chat_id: Optional[str], chat_name: Optional[str], ttl: float):
+        """
+        Remember how a contact name resolved
+
+        Args:
+            name: Name as the caller spelled it
+            chat_id: Bridge chat ID, None to cache a miss
+            chat_name: Display name of the chat
+            ttl: Seconds the entry stays valid
+        """
+        self._contact_cache[name.strip().lower()] = (chat_id, chat_name, time.monotonic() + ttl)
+
+    def _resolve_contact(self, contact_name: str) -> Optional[tuple]:
+        """
+        Resolve a contact name to a chat, from cache or via the bridge search
+
+        Args:
+            contact_name: Name of contact or group
+
+        Returns:
+            (chat_id, chat_name), or None if not found or the search failed
+        """
+        key = contact_name.strip().lower()
+        cached = self._contact_cache.get(key)
+        if cached and cached[2] > time.monotonic():
+            if cached[0] is None:
+                logger.error(f"Contact not found: {contact_name}")
+                self._log_debug(f"Contact not found: {contact_name}", "ERROR")
+                return None
+            return cached[0], cached[1]
+
+        # Search for the contact
+        search_response = self._http.post(
+            f"{self.bridge_url}/contacts/search",
+            data=_dumps({"query": contact_name}),
+            headers=_JSON_HEADERS,
+            timeout=5
+        )
 
-            if search_response.status_code != 200:
-                logger.error(f"Failed to search for contact: {contact_name}")
-                return False
+        if search_response.status_code != 200:
+            logger.error(f"Failed to search for contact: {contact_name}")
+            return None
 
-            results = search_response.json().get('results', [])
+        results = _loads(search_response.content).get('results', [])
 
-            if not results:
-                logger.error(f"Contact not found: {contact_name}")
-                self._log_debug(f"Contact not found: {contact_name}", "ERROR")
-                return False
+        if not results:
+            logger.error(f"Contact not found: {contact_name}")
+            self._log_debug(f"Contact not found: {contact_name}", "ERROR")
+            self._cache_contact(contact_name, None, None, NEGATIVE_CONTACT_TTL)
+            return None
 
-            # Use first match
-            chat_id = results[0]['id']
-            chat_name = results[0]['name']
+        # Use first match
+        chat_id = results[0]['id']
+        chat_name = results[0]['name']
+        self._cache_contact(contact_name, chat_id, chat_name, CONTACT_TTL)
+        return chat_id, chat_name
+
+    def send_message(self, contact_name: str, message: str) -> bool:
+        """Send a message to a contact"""
+        try:
+            contact = self._resolve_contact(contact_name)
+            if contact is None:
+                return False
+            chat_id, chat_name = contact
 
             logger.info(f"Sending message to {chat_name}...")
             self._log_debug(f"Sending to {chat_name}...", "INFO")
 
             # Send message
-            send_response = requests.post(
+            send_response = self._http.post(
                 f"{self.bridge_url}/messages/send",
-                json={
+                data=_dumps({
                     "chatId": chat_id,
                     "message": message
-                },
+                }),
+                headers=_JSON_HEADERS,
                 timeout=10
             )
 
@@ -352,8 +531,11 @@ class WhatsAppWebJSService:
                 self._log_debug(f"✓ Message sent to {chat_name}", "SUCCESS")
                 return True
             else:
-                error = send_response.json().get('error', 'Unknown error')
+                error = _loads(send_response.content).get('error', 'Unknown error')
                 logger.error(f"Failed to send message: {error}")
+
+                # The cached chat may be stale; search again next time
+                self._contact_cache.pop(contact_name.strip().lower(), None)
                 self._log_debug(f"Send failed: {error}", "ERROR")
                 return False
 
@@ -362,12 +544,70 @@ class WhatsAppWebJSService:
             self._log_debug(f"Error: {e}", "ERROR")
             return False
 
+    def send_messages(self, pairs: List[tuple]) -> List[bool]:
+        """
+        Send several messages in one bridge request
+
+        Args:
+            pairs: (contact_name, message) tuples
+
+        Returns:
+            Per-message success flags, in input order
+        """
+        sent = [False] * len(pairs)
+
+        # Resolve every contact first (mostly cache hits); unresolved ones just fail
+        batch = []
+        positions = []
+        for i, (contact_name, message) in enumerate(pairs):
+            try:
+                contact = self._resolve_contact(contact_name)
+            except Exception as e:
+                logger.error(f"Error resolving contact {contact_name}: {e}")
+                contact = None
+            if contact is not None:
+                batch.append({"chatId": contact[0], "message": message})
+                positions.append(i)
+
+        if not batch:
+            return sent
+
+        try:
+            logger.info(f"Sending {len(batch)} message(s) in one batch...")
+            response = self._http.post(
+                f"{self.bridge_url}/messages/send_batch",
+                data=_dumps({"messages": batch}),
+                headers=_JSON_HEADERS,
+                timeout=10 + 2 * len(batch)
+            )
+
+            if response.status_code != 200:
+                error = _loads(response.content).get('error', 'Unknown error')
+                logger.error(f"Failed to send message batch: {error}")
+                self._log_debug(f"Batch send failed: {error}", "ERROR")
+                return sent
+
+            for i, result in zip(positions, _loads(response.content).get('results', [])):
+                sent[i] = bool(result.get('success'))
+                if not sent[i]:
+                    logger.error(f"Failed to send message to {pairs[i][0]}: {result.get('error')}")
+                    self._contact_cache.pop(pairs[i][0].strip().lower(), None)
+
+            logger.info(f"✓ Sent {sum(sent)}/{len(pairs)} message(s)")
+            self._log_debug(f"✓ Sent {sum(sent)}/{len(pairs)} message(s)", "SUCCESS")
+
+        except Exception as e:
+            logger.error(f"Error sending message batch: {e}")
+            self._log_debug(f"Error: {e}", "ERROR")
+
+        return sent
+
     def get_chats(self) -> List[dict]:
         """Get all chats"""
         try:
-            response = requests.get(f"{self.bridge_url}/chats", timeout=5)
+            response = self._http.get(f"{self.bridge_url}/chats", timeout=5)
             if response.status_code == 200:
-                return response.json().get('chats', [])
+                return _loads(response.content).get('chats', [])
         except Exception as e:
             logger.error(f"Error getting chats: {e}")
 
@@ -376,13 +616,13 @@ class WhatsAppWebJSService:
     def get_chat_messages(self, chat_id: str, limit: int = 50) -> List[dict]:
         """Get messages from a specific chat"""
         try:
-            response = requests.get(
+            response = self._http.get(
                 f"{self.bridge_url}/chats/{chat_id}/messages",
                 params={"limit": limit},
                 timeout=10
             )
             if response.status_code == 200:
-                return response.json().get('messages', [])
+                return _loads(response.content).get('messages', [])
         except Exception as e:
             logger.error(f"Error getting chat messages: {e}")
 
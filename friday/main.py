@@ -2,6 +2,7 @@
 Jarvis AI Assistant - Main Application
 """
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from friday.utils.logger import get_logger
@@ -9,7 +10,7 @@ from friday.config import Config
 from friday.gui.main_window import MainWindow
 from friday.models.conversation import Conversation
 from friday.ai.openai_client import OpenAIClient
-from friday.ai.text_to_speech import TextToSpeech
+from friday.ai.text_to_speech import TextToSpeech, is_sentence_boundary
 from friday.ai.speech_to_text import SpeechToText
 from friday.ai.vision_handler import encode_image_for_gpt4o
 from friday.audio.audio_recorder import AudioRecorder
@@ -49,6 +50,12 @@ class FridayApp:
         self.tts = TextToSpeech()
         self.stt = SpeechToText()
 
+        # Transcribes phrases while recording is still in progress
+        self.stt_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="stt")
+
+        # Open the shared API connection before the first wake word
+        threading.Thread(target=self.openai_client.warmup, daemon=True).start()
+
         # Initialize audio components
         self.audio_recorder = AudioRecorder()
         self.wake_word_detector = WakeWordDetector(callback=self._on_wake_word_detected)
@@ -256,7 +263,8 @@ class FridayApp:
                 {"role": "system", "content": self.system_prompt}
             ] + messages
 
-            response_text = self.openai_client.chat_completion(messages_with_prompt)
+            # Stream the reply; sentences are spoken while the rest is generated
+            response_text = self._stream_response_with_speech(messages_with_prompt)
 
             # Add to conversation
             self.conversation.add_assistant_message(response_text)
@@ -269,9 +277,8 @@ class FridayApp:
             # Update GUI with response (use cleaned version without SEND_WHATSAPP commands)
             self.window.add_event("ai_response", {"text": cleaned_response})
 
-            # Speak response
-            self.window.add_event("status_update", {"status": "Speaking"})
-            self.tts.speak(cleaned_response, play_audio=True)
+            # The bubble is up; stay "Speaking" until every sentence has been synthesized
+            self.tts.wait_for_queued_speech()
 
             self.window.add_event("status_update", {"status": "Idle"})
 
@@ -283,6 +290,65 @@ class FridayApp:
         finally:
             self.is_processing = False
 
+    def _stream_response_with_speech(self, messages):
+        """
+        Stream the AI response and speak each sentence as soon as it is complete
+
+        SEND_WHATSAPP command lines are never spoken; they are handled
+        after the full response has arrived. Returns as soon as the text
+        is complete, while queued sentences may still be synthesizing.
+
+        Args:
+            messages: Messages for the API, system prompt included
+
+        Returns:
+            str: Full response text
+        """
+        response_parts = []
+        pending = ""
+        token_count = 0
+        in_command = False
+        started_speaking = False
+
+        def speak_chunk(chunk):
+            nonlocal started_speaking
+            chunk = chunk.strip()
+            if not chunk:
+                return
+            if not started_speaking:
+                self.window.add_event("status_update", {"status": "Speaking"})
+                started_speaking = True
+            self.tts.speak_queued(chunk)
+
+        for token in self.openai_client.chat_stream(messages):
+            response_parts.append(token)
+            pending += token
+            token_count += 1
+
+            if not in_command and "SEND_WHATSAPP" in pending:
+                # Speak what came before the command, then skip the command line
+                spoken, marker, command = pending.partition("SEND_WHATSAPP")
+                speak_chunk(spoken)
+                pending = marker + command
+                in_command = True
+
+            if in_command:
+                if "\n" not in pending:
+                    continue
+                pending = pending.split("\n", 1)[1]
+                in_command = False
+                token_count = 0
+
+            if is_sentence_boundary(pending, token_count):
+                speak_chunk(pending)
+                pending = ""
+                token_count = 0
+
+        if not in_command:
+            speak_chunk(pending)
+
+        return "".join(response_parts)
+
     def _handle_whatsapp_intent(self, text: str) -> bool:
         """
         Check if message is a WhatsApp command and handle it
@@ -424,15 +490,25 @@ class FridayApp:
             self.is_recording = True
             self.window.add_event("status_update", {"status": "Listening"})
 
-            # Record with silence detection
-            audio_data = self.audio_recorder.record_with_silence_detection()
+            sample_rate = self.audio_recorder.sample_rate
+            segment_futures = []
 
-            # Convert to bytes
-            audio_bytes = self.audio_recorder.recording_to_bytes(audio_data)
+            def on_segment(segment):
+                # Start transcribing each phrase while the user keeps talking
+                segment_futures.append(
+                    self.stt_executor.submit(self.stt.transcribe_array, segment, sample_rate)
+                )
 
-            # Transcribe
+            # Record with silence detection
+            audio_data = self.audio_recorder.record_with_silence_detection(on_segment=on_segment)
+
+            # Transcribe (most phrases are already done by the time silence is detected)
             self.window.add_event("status_update", {"status": "Processing"})
-            text = self.stt.transcribe_bytes(audio_bytes)
+            if segment_futures:
+                texts = [future.result().strip() for future in segment_futures]
+                text = " ".join(t for t in texts if t)
+            else:
+                text = self.stt.transcribe_array(audio_data, sample_rate)
 
             # Add to GUI as user message
             self.window.conversation_view.add_message("user", text, has_image=False)
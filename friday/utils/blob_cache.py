@@ -0,0 +1,147 @@
+"""
+Content-addressed blob cache (in-memory LRU backed by SQLite)
+"""
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from friday.utils.logger import get_logger
+
+logger = get_logger("blob_cache")
+
+
+class BlobCache:
+    """Two-level cache of bytes values keyed by a digest"""
+
+    def __init__(self, db_path, maxsize=128, max_disk_entries=2000):
+        """
+        Initialize cache
+
+        Args:
+            db_path: Path to the SQLite file backing the cache
+            maxsize: Number of entries kept in memory
+            max_disk_entries: Number of entries kept on disk
+        """
+        self.maxsize = maxsize
+        self.max_disk_entries = max_disk_entries
+
+        # OrderedDict rather than functools.lru_cache: a miss must not be
+        # memoized, since the caller fills it in after the API call
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._puts_since_prune = 0
+
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    key BLOB PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self.conn.commit()
+            logger.info(f"Blob cache opened: {db_path}")
+
+        except sqlite3.Error as e:
+            # Fall back to memory-only caching
+            logger.error(f"Failed to open blob cache {db_path}: {e}")
+            self.conn = None
+
+    def get(self, key):
+        """
+        Look up a cached value
+
+        Args:
+            key: Digest bytes
+
+        Returns:
+            bytes or None: Cached value, None on miss
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                return value
+
+            if self.conn is None:
+                return None
+
+            try:
+                row = self.conn.execute(
+                    "SELECT value FROM blobs WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                self.conn.execute(
+                    "UPDATE blobs SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+                self.conn.commit()
+
+                value = bytes(row[0])
+                self._remember(key, value)
+                return value
+
+            except sqlite3.Error as e:
+                logger.error(f"Blob cache read failed: {e}")
+                return None
+
+    def put(self, key, value):
+        """
+        Store a value
+
+        Args:
+            key: Digest bytes
+            value: Bytes to cache
+        """
+        with self._lock:
+            self._remember(key, value)
+
+            if self.conn is None:
+                return
+
+            try:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO blobs (key, value, accessed_at) VALUES (?, ?, ?)",
+                    (key, value, time.time())
+                )
+                self.conn.commit()
+
+                self._puts_since_prune += 1
+                if self._puts_since_prune >= 50:
+                    self._prune()
+
+            except sqlite3.Error as e:
+                logger.error(f"Blob cache write failed: {e}")
+
+    def _remember(self, key, value):
+        """Insert into the in-memory LRU, evicting the oldest entry if full"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _prune(self):
+        """Drop least recently used rows beyond max_disk_entries"""
+        self._puts_since_prune = 0
+        self.conn.execute(
+            """
+            DELETE FROM blobs WHERE key NOT IN (
+                SELECT key FROM blobs ORDER BY accessed_at DESC LIMIT ?
+            )
+            """,
+            (self.max_disk_entries,)
+        )
+        self.conn.commit()
+
+    def close(self):
+        """Close the backing database"""
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None